@@ -5,48 +5,251 @@ but it detects negative weight cycles.
 
 - Time Complexity: O( |V| * |E| ) 
 - Space Complexity: O( |V| + |E| )
+
+Modes:
+- "standard": |V| - 1 passes over all edges, stopping early as soon as a pass relaxes nothing
+  (the distances can no longer change). On most graphs this needs far fewer than |V| - 1 passes.
+- "spfa": Shortest Path Faster Algorithm, only re-relaxes the out-edges of vertices whose
+  distance just changed, using a FIFO queue. Same worst case, usually O(|E|) on random graphs.
+  A vertex relaxed |V| times means a negative cycle.
+- "numpy": edges as NumPy source / destination / weight arrays, each pass relaxes all edges at
+  once with np.minimum.at, with the same early exit.
+
+A negative weight cycle reachable from the source raises NegativeCycleError carrying
+- cycle: the vertices of one negative cycle in edge order (cycle[-1] -> cycle[0] closes it)
+- affected: every vertex reachable from a negative cycle, i.e. with no shortest distance
+- distance: the distances with -inf for the affected vertices
+Predecessors are tracked during the relaxations, so one extra pass over the edges is
+enough to find both; no second run is needed.
 """
 
+import sys
+from collections import deque
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+INF = float('inf')
+
 class Edge:
     def __init__(self, source, destination, weight):
         self.source = source
         self.destination = destination
         self.weight = weight
 
-def bellman_ford(vertices, edges, source):
-    # Step 1: Initialize distances
-    distance = [float('inf')] * vertices
+class NegativeCycleError(ValueError):
+    def __init__(self, cycle, affected, distance):
+        path = " -> ".join(str(v) for v in cycle + cycle[:1])
+        super().__init__(f"Graph contains a negative weight cycle: {path}")
+        self.cycle = cycle
+        self.affected = affected
+        self.distance = distance
+
+def bellman_ford(vertices, edges, source, mode="standard"):
+    if mode == "spfa":
+        return bellman_ford_spfa(vertices, edges, source)
+    if mode == "numpy":
+        return bellman_ford_numpy(vertices, edge_arrays(edges), source)
+    if mode != "standard":
+        raise ValueError(f"Unknown mode {mode!r}, expected 'standard', 'spfa' or 'numpy'")
+
+    # Step 1: Initialize distances and predecessors
+    distance = [INF] * vertices
     distance[source] = 0
+    pred = [-1] * vertices
 
-    # Step 2: Relax edges |V| - 1 times
+    # Step 2: Relax edges |V| - 1 times, stop early once a pass changes nothing
     for _ in range(vertices - 1):
+        changed = False
         for edge in edges:
-            if distance[edge.source] != float('inf') and distance[edge.source] + edge.weight < distance[edge.destination]:
-                distance[edge.destination] = distance[edge.source] + edge.weight
+            d = distance[edge.source]
+            if d != INF and d + edge.weight < distance[edge.destination]:
+                distance[edge.destination] = d + edge.weight
+                pred[edge.destination] = edge.source
+                changed = True
+        if not changed:
+            return distance
 
     # Step 3: Check for negative weight cycles
+    check_negative_cycle(vertices, _triples(edges), distance, pred)
+    return distance
+
+def bellman_ford_spfa(vertices, edges, source):
+    # Out-edges per vertex, so only the neighbors of changed vertices are visited
+    adj = [[] for _ in range(vertices)]
     for edge in edges:
-        if distance[edge.source] != float('inf') and distance[edge.source] + edge.weight < distance[edge.destination]:
-            print("Graph contains a negative weight cycle")
-            return None
+        adj[edge.source].append((edge.destination, edge.weight))
+
+    distance = [INF] * vertices
+    distance[source] = 0
+    pred = [-1] * vertices
+    in_queue = [False] * vertices
+    relaxed = [0] * vertices  # how many times each vertex got a shorter distance
+    queue = deque([source])
+    in_queue[source] = True
+
+    while queue:
+        u = queue.popleft()
+        in_queue[u] = False
+        for v, w in adj[u]:
+            if distance[u] + w < distance[v]:
+                distance[v] = distance[u] + w
+                pred[v] = u
+                relaxed[v] += 1
+                # A shortest path has at most |V| - 1 edges, so |V| improvements mean a negative cycle.
+                # Finish with full passes so every cycle and every affected vertex is found.
+                if relaxed[v] >= vertices:
+                    triples = _triples(edges)
+                    for _ in range(vertices - 1):
+                        if not _relax_pass(triples, distance, pred):
+                            break
+                    check_negative_cycle(vertices, triples, distance, pred)
+                    return distance
+                if not in_queue[v]:
+                    queue.append(v)
+                    in_queue[v] = True
+
+    return distance
+
+def edge_arrays(edges):
+    # (sources, destinations, weights) NumPy arrays from a list of Edge objects
+    if np is None:
+        raise ImportError("mode='numpy' requires numpy")
+    if isinstance(edges, tuple):
+        return edges
+    src = np.fromiter((e.source for e in edges), dtype=np.int64, count=len(edges))
+    dst = np.fromiter((e.destination for e in edges), dtype=np.int64, count=len(edges))
+    weight = np.fromiter((e.weight for e in edges), dtype=np.float64, count=len(edges))
+    return src, dst, weight
 
+def bellman_ford_numpy(vertices, arrays, source):
+    src, dst, weight = arrays
+    distance = np.full(vertices, np.inf)
+    distance[source] = 0
+    pred = np.full(vertices, -1, dtype=np.int64)
+
+    # Every pass relaxes all edges at once: candidate = dist[src] + w, min-reduced per destination
+    for _ in range(vertices - 1):
+        candidate = distance[src] + weight
+        updated = distance.copy()
+        np.minimum.at(updated, dst, candidate)
+        # The predecessor of an improved vertex is any edge that produced its new minimum
+        won = (candidate < distance[dst]) & (candidate == updated[dst])
+        if not won.any():
+            return distance.tolist()
+        pred[dst[won]] = src[won]
+        distance = updated
+
+    # Only build Python lists when there is something left to relax
+    if not np.any(distance[src] + weight < distance[dst]):
+        return distance.tolist()
+    distance = distance.tolist()
+    check_negative_cycle(vertices, _triples(arrays), distance, pred.tolist())
     return distance
 
-# Example usage
-edges = [
-    Edge(0, 1, 4),
-    Edge(0, 2, 5),
-    Edge(1, 2, -3),
-    Edge(1, 3, 2),
-    Edge(2, 3, 6)
-]
+def check_negative_cycle(vertices, triples, distance, pred):
+    # One extra pass: an edge that still relaxes after |V| - 1 passes lies on or behind a negative cycle
+    relaxed = _relax_pass(triples, distance, pred)
+    if not relaxed:
+        return
+
+    # Walk the predecessors back from a relaxed vertex until one repeats, that loop is a negative cycle
+    cycle = []
+    for start in relaxed:
+        order = {}
+        x = start
+        while x != -1 and x not in order:
+            order[x] = len(order)
+            x = pred[x]
+        if x != -1:
+            walk = list(order)
+            cycle = walk[order[x]:][::-1]
+            break
+
+    # Everything reachable from a relaxed vertex has no shortest distance
+    adj = [[] for _ in range(vertices)]
+    for u, v, _ in triples:
+        adj[u].append(v)
+    affected = set(relaxed)
+    queue = deque(affected)
+    while queue:
+        u = queue.popleft()
+        for v in adj[u]:
+            if v not in affected:
+                affected.add(v)
+                queue.append(v)
+    for v in affected:
+        distance[v] = -INF
+
+    raise NegativeCycleError(cycle, sorted(affected), distance)
+
+def _relax_pass(triples, distance, pred):
+    relaxed = []
+    for u, v, w in triples:
+        d = distance[u]
+        if d != INF and d + w < distance[v]:
+            distance[v] = d + w
+            pred[v] = u
+            relaxed.append(v)
+    return relaxed
+
+def _triples(edges):
+    # (source, destination, weight) tuples from Edge objects or NumPy edge arrays
+    if isinstance(edges, tuple):
+        return list(zip(*(a.tolist() for a in edges)))
+    return [(e.source, e.destination, e.weight) for e in edges]
+
+# Benchmark: the three modes on a random graph with 1M edges
+def benchmark(vertices=100_000, num_edges=1_000_000):
+    import random
+    import time
+
+    rng = random.Random(1)
+    edges = [Edge(rng.randrange(vertices), rng.randrange(vertices), rng.randint(1, 100))
+             for _ in range(num_edges)]
+    edges += [Edge(v, v + 1, 100) for v in range(vertices - 1)]  # every vertex reachable
+    arrays = edge_arrays(edges)
+
+    results = {}
+    for mode in ("standard", "spfa", "numpy"):
+        start = time.perf_counter()
+        results[mode] = bellman_ford(vertices, arrays if mode == "numpy" else edges, 0, mode)
+        print(f"{mode:<9} {time.perf_counter() - start:7.2f}s")
+    assert results["standard"] == results["spfa"] == results["numpy"]
+
+# Driver Code
+def main():
+    edges = [
+        Edge(0, 1, 4),
+        Edge(0, 2, 5),
+        Edge(1, 2, -3),
+        Edge(1, 3, 2),
+        Edge(2, 3, 6)
+    ]
+
+    vertices = 4  # Number of vertices
+    source = 0  # Source vertex
+
+    modes = ["standard", "spfa"] + (["numpy"] if np is not None else [])
+    for mode in modes:
+        shortest_distances = bellman_ford(vertices, edges, source, mode)
 
-vertices = 4  # Number of vertices
-source = 0  # Source vertex
+        print(f"Vertex Distance from Source ({mode})")
+        for i, d in enumerate(shortest_distances):
+            print(f"{i} \t {d}")
 
-shortest_distances = bellman_ford(vertices, edges, source)
+    # Arbitrage-style cycles: 1 -> 3 -> 1 has total weight -7, and 4 hangs off it
+    edges.append(Edge(3, 1, -9))
+    edges.append(Edge(3, 4, 1))
+    try:
+        bellman_ford(5, edges, source)
+    except NegativeCycleError as e:
+        print(e)
+        print("Affected vertices:", e.affected)
 
-if shortest_distances:
-    print("Vertex Distance from Source")
-    for i, d in enumerate(shortest_distances):
-        print(f"{i} \t {d}")
+if __name__ == "__main__":
+    main()
+    if "--bench" in sys.argv:
+        benchmark()
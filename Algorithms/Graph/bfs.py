@@ -1,46 +1,34 @@
 from collections import defaultdict
+import traversal
 
 # This class represents an undirected graph using adjacency list representation
 class Graph:
 
 # Constructor
-    def __init__(self):
+    def __init__(self, csr=None):
 
-        # Default dictionary to store graph
-        self.graph = defaultdict(list)
+        # Default dictionary to store graph, or the neighbor
+        # lists of an undirected csr_graph.CSRGraph
+        self.graph = defaultdict(list) if csr is None else csr.neighbor_view()
+        self.csr = csr
 
     # Function to add an edge to graph
     def addEdge(self, v, w):
+        # A CSR graph is read-only, its neighbor lists are copies
+        if self.csr is not None:
+            raise ValueError("Cannot add edges to a graph built from a CSRGraph")
         self.graph[v].append(w)
         self.graph[w].append(v)
 
     # Function to print a bfsTraversal of graph
     def bfsTraversal(self, vertex):
+        for i in self.bfsIter(vertex):
+            print (i, end = " ")
 
-        # Mark all the vertices as not visited
-        visited = set()
-
-        # Create a queue for bfsTraversal
-        queue = []
-
-        # Mark the source node as
-        # visited and enqueue it
-        queue.append(vertex)
-        visited.add(vertex)
-
-        while queue:
-
-            # Dequeue a vertex from
-            # Queue and print it
-            vertex = queue.pop(0)
-            print (vertex, end = " ")
-
-            # Get all adjacent vertices of the dequeued vertex vertex.
-            # If a adjacent has not been visited, then mark it visited and enqueue it
-            for i in self.graph[vertex]:
-                if i not in visited:
-                    queue.append(i)
-                    visited.add(i)
+    # Generator version of bfsTraversal, yields vertices lazily.
+    # See traversal.bfs for with_info / visit / stop
+    def bfsIter(self, vertex, **options):
+        return traversal.bfs(self.graph, vertex, **options)
 
 # Create a graph given
 graph = Graph()
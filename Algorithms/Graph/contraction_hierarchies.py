@@ -0,0 +1,265 @@
+'''
+Contraction Hierarchies (Geisberger et al.) for repeated point-to-point queries on a static graph.
+
+Preprocessing:
+1. Order the vertices by "importance" (edge difference = shortcuts added - edges removed,
+   plus the number of already contracted neighbors to spread contraction evenly).
+2. Contract them one by one in that order. Contracting v removes it from the graph; for every
+   pair of remaining neighbors u -> v -> w, a shortcut u -> w with weight w(u, v) + w(v, w)
+   is added unless a "witness" path u -> w avoiding v is at least as short.
+3. Keep the upward graph: every original edge and shortcut, stored at its lower-ranked end.
+
+Query: a bidirectional Dijkstra where both searches only relax edges towards higher ranked
+vertices. Every shortest path has a "peak" vertex, and the forward search from the source
+and the backward search from the target both reach it going upwards. The upward search
+spaces are tiny (a few hundred vertices on road networks), which is what makes queries
+orders of magnitude faster than plain Dijkstra.
+
+The index is built from the same {u: [(v, weight), ...]} dict (or csr_graph.CSRGraph) used by
+dijkstra_heap.Dijkstra and persisted as rank + two CSR upward graphs in a binary file.
+
+- Build Time Complexity: depends on the ordering, near linear on road networks
+- Query Time Complexity: O(S log S) where S is the (small) upward search space
+'''
+
+import heapq
+import struct
+import sys
+from array import array
+from math import inf
+
+from csr_graph import CSRGraph
+
+
+class ContractionHierarchy:
+    MAGIC = b"CH01"
+
+    def __init__(self, rank, up, down):
+        self.rank = rank    # contraction position of every vertex
+        self.up = up        # CSRGraph of edges u -> v with rank[v] > rank[u]
+        self.down = down    # CSRGraph of reversed edges: for v, the u with u -> v and rank[u] > rank[v]
+
+    @classmethod
+    def build(cls, graph, witness_limit=50):
+        n = len(graph)
+        # Step 1: Mutable copies of the out- and in-edges, keeping the lightest parallel edge
+        out_edges = [dict() for _ in range(n)]
+        in_edges = [dict() for _ in range(n)]
+        for u in range(n):
+            for v, w in graph[u]:
+                if u != v and w < out_edges[u].get(v, inf):
+                    out_edges[u][v] = w
+                    in_edges[v][u] = w
+
+        contracted = bytearray(n)
+        contracted_neighbors = [0] * n
+        rank = array('q', [0]) * n
+        upward = []     # (u, v, w) edges, u contracted before v
+        downward = []   # (v, u, w) for edges u -> v with u contracted after v
+
+        def shortcuts_for(v):
+            # Pairs (u, w, weight) that need a shortcut when v is contracted
+            needed = []
+            for u, w_in in in_edges[v].items():
+                limit = w_in + max(out_edges[v].values(), default=0)
+                dist = _witness_search(out_edges, u, v, limit, witness_limit)
+                for w, w_out in out_edges[v].items():
+                    if w != u and dist.get(w, inf) > w_in + w_out:
+                        needed.append((u, w, w_in + w_out))
+            return needed
+
+        def priority(v):
+            removed = len(in_edges[v]) + len(out_edges[v])
+            return len(shortcuts_for(v)) - removed + contracted_neighbors[v]
+
+        # Step 2: Contract vertices in priority order, lazily re-checking priorities
+        pqueue = [(priority(v), v) for v in range(n)]
+        heapq.heapify(pqueue)
+        order = 0
+        while pqueue:
+            _, v = heapq.heappop(pqueue)
+            if contracted[v]:
+                continue
+            current = priority(v)
+            if pqueue and current > pqueue[0][0]:
+                heapq.heappush(pqueue, (current, v))
+                continue
+
+            for u, w, weight in shortcuts_for(v):
+                if weight < out_edges[u].get(w, inf):
+                    out_edges[u][w] = weight
+                    in_edges[w][u] = weight
+
+            # Step 3: v's remaining edges all go to higher ranked vertices
+            for w, weight in out_edges[v].items():
+                upward.append((v, w, weight))
+                del in_edges[w][v]
+                contracted_neighbors[w] += 1
+            for u, weight in in_edges[v].items():
+                downward.append((v, u, weight))
+                del out_edges[u][v]
+                contracted_neighbors[u] += 1
+            out_edges[v].clear()
+            in_edges[v].clear()
+
+            contracted[v] = 1
+            rank[v] = order
+            order += 1
+
+        return cls(rank, CSRGraph.from_edges(n, upward, weighted=True),
+                   CSRGraph.from_edges(n, downward, weighted=True))
+
+    def query(self, source, target, stats=None):
+        # Bidirectional upward Dijkstra, returns the distance (inf if unreachable)
+        graphs = (self.up, self.down)
+        dist = ({source: 0}, {target: 0})
+        pqueues = ([(0, source)], [(0, target)])
+        done = (set(), set())
+        best = inf
+        settled = 0
+
+        while pqueues[0] or pqueues[1]:
+            for side in (0, 1):
+                if not pqueues[side]:
+                    continue
+                d, u = heapq.heappop(pqueues[side])
+                # Upward searches cannot stop at the first meeting, only once the queue passes best
+                if d >= best:
+                    pqueues[side].clear()
+                    continue
+                if u in done[side]:
+                    continue
+                done[side].add(u)
+                settled += 1
+                if u in dist[1 - side]:
+                    best = min(best, d + dist[1 - side][u])
+
+                for v, w in graphs[side][u]:
+                    if d + w < dist[side].get(v, inf):
+                        dist[side][v] = d + w
+                        heapq.heappush(pqueues[side], (d + w, v))
+
+        if stats is not None:
+            stats["settled"] = settled
+        return best
+
+    def save(self, path):
+        # Header: magic, vertex count, edge counts, typecodes; then the raw arrays.
+        # A half without weights (e.g. built elsewhere) is stored as weight 1 per edge.
+        weights = [graph.weights if graph.weights is not None else array('q', [1]) * graph.num_edges
+                   for graph in (self.up, self.down)]
+        with open(path, "wb") as f:
+            f.write(self.MAGIC)
+            f.write(struct.pack("<qqq", len(self.rank), self.up.num_edges, self.down.num_edges))
+            f.write(struct.pack("<cc", weights[0].typecode.encode(), weights[1].typecode.encode()))
+            self.rank.tofile(f)
+            for graph, graph_weights in zip((self.up, self.down), weights):
+                graph.offsets.tofile(f)
+                graph.targets.tofile(f)
+                graph_weights.tofile(f)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            if f.read(4) != cls.MAGIC:
+                raise ValueError(f"{path} is not a contraction hierarchy file")
+            n, up_edges, down_edges = struct.unpack("<qqq", f.read(24))
+            typecodes = [c.decode() for c in struct.unpack("<cc", f.read(2))]
+
+            def read(typecode, count):
+                buf = array(typecode)
+                buf.fromfile(f, count)
+                return buf
+
+            rank = read('q', n)
+            graphs = []
+            for m, typecode in zip((up_edges, down_edges), typecodes):
+                graphs.append(CSRGraph(read('q', n + 1), read('i', m), read(typecode, m)))
+        return cls(rank, *graphs)
+
+
+def _witness_search(out_edges, source, skip, limit, max_settled):
+    # Bounded Dijkstra from source that ignores `skip`, used to decide if a shortcut is needed
+    dist = {source: 0}
+    pqueue = [(0, source)]
+    settled = 0
+    while pqueue and settled < max_settled:
+        d, u = heapq.heappop(pqueue)
+        if d > limit:
+            break
+        if d > dist[u]:
+            continue
+        settled += 1
+        for v, w in out_edges[u].items():
+            if v != skip and d + w < dist.get(v, inf):
+                dist[v] = d + w
+                heapq.heappush(pqueue, (d + w, v))
+    return dist
+
+
+# Benchmark: build time, query time and settled vertices vs plain Dijkstra
+def benchmark(rows=100, cols=100, queries=200):
+    import os
+    import random
+    import tempfile
+    import time
+    from dijkstra_heap import Dijkstra
+    from dijkstra_point_to_point import dijkstra_target, grid_graph
+
+    graph = grid_graph(rows, cols)
+    start = time.perf_counter()
+    ch = ContractionHierarchy.build(graph)
+    print(f"{rows}x{cols} grid: build {time.perf_counter() - start:.2f}s, "
+          f"{ch.up.num_edges + ch.down.num_edges} upward edges")
+
+    path = os.path.join(tempfile.mkdtemp(), "grid.ch")
+    ch.save(path)
+    start = time.perf_counter()
+    ch = ContractionHierarchy.load(path)
+    print(f"load {1000 * (time.perf_counter() - start):.1f}ms")
+
+    rng = random.Random(3)
+    pairs = [(rng.randrange(rows * cols), rng.randrange(rows * cols)) for _ in range(queries)]
+    for name, query in (("Dijkstra", lambda s, t, st: (st.update(settled=rows * cols), Dijkstra(graph, s)[t])[1]),
+                        ("early exit", lambda s, t, st: dijkstra_target(graph, s, t, st)[0]),
+                        ("CH", ch.query)):
+        settled = 0
+        start = time.perf_counter()
+        for s, t in pairs[:20] if name == "Dijkstra" else pairs:
+            stats = {}
+            query(s, t, stats)
+            settled += stats["settled"]
+        count = 20 if name == "Dijkstra" else queries
+        print(f"{name:<11} {1000 * (time.perf_counter() - start) / count:8.3f} ms/query,"
+              f" {settled // count} settled")
+
+
+# Driver Code
+def main():
+    import os
+    import tempfile
+
+    graph = {
+        0: [(1, 1)],
+        1: [(0, 1), (2, 2), (3, 3)],
+        2: [(1, 2), (3, 1), (4, 5)],
+        3: [(1, 3), (2, 1), (4, 1)],
+        4: [(2, 5), (3, 1)]
+    }
+    ch = ContractionHierarchy.build(graph)
+    print("Rank:", list(ch.rank))
+    print("Distances from 0:", [ch.query(0, t) for t in range(5)])
+
+    # Save / load round trip, also when a half of the hierarchy has no edges
+    path = os.path.join(tempfile.mkdtemp(), "graph.ch")
+    for name, g in (("full", graph), ("one edge", {0: [(1, 2)], 1: []}), ("edgeless", {0: [], 1: []})):
+        ContractionHierarchy.build(g).save(path)
+        loaded = ContractionHierarchy.load(path)
+        print(f"Loaded {name}: distance 0 -> 1 = {loaded.query(0, 1)}")
+    os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
+    if "--bench" in sys.argv:
+        benchmark()
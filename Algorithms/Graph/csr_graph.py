@@ -0,0 +1,266 @@
+'''
+Compressed Sparse Row (CSR) representation of a graph.
+
+Instead of a dict of Python lists, all edges live in three flat arrays:
+- offsets[u] .. offsets[u + 1] is the slice of `targets` / `weights` holding the out-edges of u
+- targets[i] is the destination vertex of edge i
+- weights[i] is the weight of edge i (None for unweighted graphs)
+
+A dict-of-lists costs roughly 100 bytes per edge (a boxed int, a list slot, a tuple for weighted
+graphs), while CSR stores 4 bytes per target plus 8 bytes per weight.
+
+The arrays are stdlib `array.array` objects, but any indexable buffer works (memoryview, numpy array),
+so a CSRGraph can also be built on top of shared memory or a memory-mapped file.
+
+`graph[u]` yields (neighbor, weight) pairs exactly like the dict adjacency used by
+dijkstra_heap.Dijkstra and mst_prim.prim, so those accept a CSRGraph directly.
+
+- Build Time Complexity: O(V + E)
+- Space Complexity: O(V + E)
+'''
+
+import sys
+from array import array
+from itertools import repeat
+
+
+class CSRGraph:
+    def __init__(self, offsets, targets, weights=None):
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.num_vertices = len(offsets) - 1
+
+    @classmethod
+    def from_edges(cls, vertices, edges, directed=True, weighted=None):
+        # edges is a list of (u, v) or (u, v, weight) tuples, it is scanned twice.
+        # weighted=None: weighted if any edge has a weight. A weighted graph always gets
+        # a weights array (empty if there are no edges), 2-tuples in it weigh 1.
+        # Step 1: Count the out-degree of every vertex
+        degree = array('q', bytes(8 * (vertices + 1)))
+        has_weights = False
+        for edge in edges:
+            degree[edge[0] + 1] += 1
+            if not directed:
+                degree[edge[1] + 1] += 1
+            has_weights = has_weights or len(edge) == 3
+        if weighted is None:
+            weighted = has_weights
+
+        # Step 2: Prefix sums give the start of every vertex's slice
+        for u in range(vertices):
+            degree[u + 1] += degree[u]
+        offsets = degree
+        num_edges = offsets[vertices]
+
+        # Step 3: Scatter every edge into its slot
+        targets = array('i', bytes(4 * num_edges))
+        weights = _weight_array(edges, num_edges) if weighted else None
+        cursor = array('q', offsets[:vertices])
+        for edge in edges:
+            u, v = edge[0], edge[1]
+            w = (edge[2] if len(edge) == 3 else 1) if weighted else None
+            targets[cursor[u]] = v
+            if weighted:
+                weights[cursor[u]] = w
+            cursor[u] += 1
+            if not directed:
+                targets[cursor[v]] = u
+                if weighted:
+                    weights[cursor[v]] = w
+                cursor[v] += 1
+
+        return cls(offsets, targets, weights)
+
+    @classmethod
+    def from_adjacency(cls, graph):
+        # graph is the {u: [(v, weight), ...]} dict used by Dijkstra and Prim
+        vertices = max(graph) + 1 if graph else 0
+        edges = [(u, v, w) for u in graph for v, w in graph[u]]
+        return cls.from_edges(vertices, edges, weighted=True)
+
+    def __len__(self):
+        return self.num_vertices
+
+    def __getitem__(self, u):
+        # Weighted adjacency, same shape as graph[u] in the dict representation
+        start, end = self.offsets[u], self.offsets[u + 1]
+        if self.weights is None:
+            return zip(self.targets[start:end], repeat(1, end - start))
+        return zip(self.targets[start:end], self.weights[start:end])
+
+    @property
+    def num_edges(self):
+        return self.offsets[self.num_vertices]
+
+    def neighbors(self, u):
+        return self.targets[self.offsets[u]:self.offsets[u + 1]]
+
+    def degree(self, u):
+        return self.offsets[u + 1] - self.offsets[u]
+
+    def edges(self):
+        # Iterate over (u, v, weight) tuples, e.g. to feed mst_kruskal.kruskal
+        for u in range(self.num_vertices):
+            for v, w in self[u]:
+                yield u, v, w
+
+    def reverse(self):
+        # Transposed graph (every edge u -> v becomes v -> u), i.e. the in-edges of each vertex.
+        # Same counting sort as from_edges, done directly on the arrays.
+        n, m = self.num_vertices, self.num_edges
+        offsets = array('q', bytes(8 * (n + 1)))
+        for v in self.targets[:m]:
+            offsets[v + 1] += 1
+        for v in range(n):
+            offsets[v + 1] += offsets[v]
+
+        targets = array('i', bytes(4 * m))
+        weights = None if self.weights is None else array(_typecode(self.weights), [0]) * m
+        cursor = array('q', offsets[:n])
+        for u in range(n):
+            for i in range(self.offsets[u], self.offsets[u + 1]):
+                v = self.targets[i]
+                targets[cursor[v]] = u
+                if weights is not None:
+                    weights[cursor[v]] = self.weights[i]
+                cursor[v] += 1
+        return CSRGraph(offsets, targets, weights)
+
+    def neighbor_view(self):
+        # view[u] -> neighbors of u, for the unweighted traversals (BFS, DFS, topological sort)
+        return NeighborView(self)
+
+    def nbytes(self):
+        total = 0
+        for buf in (self.offsets, self.targets, self.weights):
+            if buf is not None:
+                total += len(buf) * buf.itemsize
+        return total
+
+    def as_numpy(self):
+        # Zero-copy numpy views over the same buffers
+        import numpy as np
+        weights = None if self.weights is None else np.frombuffer(self.weights, dtype=_dtype(self.weights))
+        return (np.frombuffer(self.offsets, dtype=_dtype(self.offsets)),
+                np.frombuffer(self.targets, dtype=_dtype(self.targets)),
+                weights)
+
+
+class NeighborView:
+    def __init__(self, graph):
+        self.graph = graph
+
+    def __len__(self):
+        return self.graph.num_vertices
+
+    def __getitem__(self, u):
+        return self.graph.neighbors(u)
+
+
+def as_adjacency(vertices, edges=None, directed=True):
+    # Shared "Build graph" step of the (vertices, edges) algorithms.
+    # Returns (number of vertices, adj) where adj[u] lists the neighbors of u.
+    # `vertices` may be a CSRGraph, in which case `edges` is ignored.
+    if isinstance(vertices, CSRGraph):
+        return vertices.num_vertices, vertices.neighbor_view()
+
+    adj = [[] for _ in range(vertices)]
+    for u, v in edges:
+        adj[u].append(v)
+        if not directed:
+            adj[v].append(u)
+    return vertices, adj
+
+
+def _weight_array(edges, num_edges):
+    # Integer weights stay integers, anything else is stored as a double
+    typecode = 'q' if all(len(edge) < 3 or isinstance(edge[2], int) for edge in edges) else 'd'
+    return array(typecode, bytes(8 * num_edges))
+
+
+def _typecode(buf):
+    return buf.typecode if isinstance(buf, array) else memoryview(buf).format
+
+
+def _dtype(buf):
+    if isinstance(buf, array):
+        return {'i': 'i4', 'l': 'i8', 'q': 'i8', 'd': 'f8', 'f': 'f4'}.get(buf.typecode, buf.typecode)
+    return memoryview(buf).format
+
+
+# Benchmark: memory and BFS throughput of dict-of-lists vs CSR
+def benchmark(vertices=200_000, num_edges=1_000_000):
+    import random
+    import time
+    import tracemalloc
+    from collections import defaultdict, deque
+
+    random.seed(1)
+    edges = [(random.randrange(vertices), random.randrange(vertices), random.randint(1, 100))
+             for _ in range(num_edges)]
+
+    def full_bfs(adj):
+        visited = bytearray(vertices)
+        scanned = 0
+        for s in range(vertices):
+            if visited[s]:
+                continue
+            visited[s] = 1
+            queue = deque([s])
+            while queue:
+                u = queue.popleft()
+                for v in adj[u]:
+                    scanned += 1
+                    if not visited[v]:
+                        visited[v] = 1
+                        queue.append(v)
+        return scanned
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    dict_graph = defaultdict(list)
+    for u, v, w in edges:
+        dict_graph[u].append((v, w))
+    dict_build = time.perf_counter() - start
+    dict_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    unweighted = {u: [v for v, _ in dict_graph[u]] for u in range(vertices)}
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    csr = CSRGraph.from_edges(vertices, edges)
+    csr_build = time.perf_counter() - start
+    csr_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    print(f"{num_edges} edges, {vertices} vertices")
+    print(f"{'layout':<16}{'bytes/edge':>12}{'build s':>10}{'BFS edges/s':>16}")
+    for name, nbytes, build, adj in (("dict-of-lists", dict_bytes, dict_build, unweighted),
+                                      ("CSR", csr_bytes, csr_build, csr.neighbor_view())):
+        start = time.perf_counter()
+        scanned = full_bfs(adj)
+        rate = scanned / (time.perf_counter() - start)
+        print(f"{name:<16}{nbytes / num_edges:>12.1f}{build:>10.2f}{rate:>16,.0f}")
+
+
+# Driver Code
+def main():
+    edges = [
+        (0, 1, 4),
+        (0, 2, 3),
+        (1, 2, 1),
+        (1, 3, 2),
+        (2, 3, 4)
+    ]
+    graph = CSRGraph.from_edges(4, edges, directed=False)
+    print("offsets:", list(graph.offsets))
+    print("targets:", list(graph.targets))
+    print("weights:", list(graph.weights))
+    print("neighbors of 1:", list(graph[1]))
+
+
+if __name__ == "__main__":
+    main()
+    if "--bench" in sys.argv:
+        benchmark()
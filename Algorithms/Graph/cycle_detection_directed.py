@@ -1,38 +1,27 @@
-from collections import defaultdict
+from csr_graph import as_adjacency
+from traversal import CycleError, postorder
 
-def detect_cycle_directed(vertices, edges):
-    def dfs(node):
-        visited[node] = True
-        rec_stack[node] = True
-        
-        # Explore neighbors
-        for neighbor in adj_list[node]:
-            if not visited[neighbor]:
-                if dfs(neighbor):
-                    return True
-            elif rec_stack[neighbor]:
-                return True
-        
-        rec_stack[node] = False  # Backtrack
-        return False
-    
-    # Build graph
-    adj_list = defaultdict(list)
-    for u, v in edges:
-        adj_list[u].append(v)
-    
-    visited = [False] * vertices
-    rec_stack = [False] * vertices
+def find_cycle(vertices, edges=None):
+    # Build graph (vertices may also be a csr_graph.CSRGraph)
+    vertices, adj_list = as_adjacency(vertices, edges)
 
-    # Run DFS for each unvisited node
-    for node in range(vertices):
-        if not visited[node]:
-            if dfs(node):
-                return True
+    # Iterative DFS with three colors, a back edge ends it with the cycle on the stack
+    try:
+        for _ in postorder(adj_list, vertices):
+            pass
+    except CycleError as e:
+        return e.cycle
+    return None
 
-    return False
+def detect_cycle_directed(vertices, edges=None):
+    return find_cycle(vertices, edges) is not None
 
-# Example Usage
-vertices = 4
-edges = [(0, 1), (1, 2), (2, 0), (3, 2)]  # This graph contains a cycle
-print("Cycle detected in directed graph:", detect_cycle_directed(vertices, edges))
+# Driver Code
+def main():
+    vertices = 4
+    edges = [(0, 1), (1, 2), (2, 0), (3, 2)]  # This graph contains a cycle
+    print("Cycle detected in directed graph:", detect_cycle_directed(vertices, edges))
+    print("Cycle:", find_cycle(vertices, edges))
+
+if __name__ == "__main__":
+    main()
@@ -1,35 +1,117 @@
-from collections import defaultdict
-
-def detect_cycle_undirected(vertices, edges):
-    def dfs(node, parent):
-        visited[node] = True
-        
-        for neighbor in adj_list[node]:
-            if not visited[neighbor]:
-                if dfs(neighbor, node):
-                    return True
-            elif neighbor != parent:
-                return True
-        
-        return False
-
-    # Build graph
-    adj_list = defaultdict(list)
+'''
+Cycle detection in undirected graphs with union-find, edge by edge.
+
+An undirected edge (u, v) closes a cycle exactly when u and v are already connected by the
+edges seen before it. union_find.DSU answers that and merges the two sets in one union()
+call, so edges can be consumed as a stream (an iterator, a generator, a file) without ever
+building adjacency lists, and the vertex count does not have to be known in advance: the
+DSU grows as new vertex ids show up.
+
+- CycleDetector: online, add_edge(u, v) returns True if that edge closes a cycle
+- cycle_edges(edges): every cycle-closing edge of an edge stream, lazily (first=True stops
+  after the first one)
+- read_edge_stream(path): (u, v) pairs from a text file, one "u v" or "u,v" per line
+- detect_cycle_undirected(vertices, edges): True / False for a whole graph
+
+Every cycle-closing edge is reported once: the edges that are not reported form a spanning
+forest, and each reported edge closes one independent cycle with it.
+
+- Time Complexity: O(alpha(V)) amortized per edge
+- Space Complexity: O(V), independent of the number of edges
+'''
+
+import sys
+
+from csr_graph import CSRGraph
+from union_find import DSU
+
+
+class CycleDetector:
+    def __init__(self, vertices=0):
+        self.dsu = DSU(vertices)
+        self.edges = 0
+        self.cycles = 0
+        self.first = None  # first cycle-closing edge
+
+    def add_edge(self, u, v):
+        if max(u, v) >= len(self.dsu):
+            # Grow geometrically, so a stream of new ids costs O(1) amortized each
+            self.dsu.extend(max(u, v) + 1 + len(self.dsu) // 2)
+        self.edges += 1
+        if self.dsu.union(u, v):
+            return False
+        # u and v were already connected (or u == v, a self-loop)
+        self.cycles += 1
+        if self.first is None:
+            self.first = (u, v)
+        return True
+
+
+def cycle_edges(edges, vertices=0, first=False):
+    # edges: any iterable of (u, v) pairs, consumed once
+    detector = CycleDetector(vertices)
     for u, v in edges:
-        adj_list[u].append(v)
-        adj_list[v].append(u)  # Add both directions for undirected graph
+        if detector.add_edge(u, v):
+            yield u, v
+            if first:
+                return
+
 
-    visited = [False] * vertices
+def read_edge_stream(path):
+    # One edge per line, "u v" or "u,v", further columns (e.g. a weight) are ignored
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            fields = line.replace(",", " ").split()
+            yield int(fields[0]), int(fields[1])
 
-    # Run DFS for each unvisited node
-    for node in range(vertices):
-        if not visited[node]:
-            if dfs(node, -1):
-                return True
 
+def detect_cycle_undirected(vertices, edges=None):
+    # An undirected csr_graph.CSRGraph stores every edge in both directions,
+    # read each one once
+    if isinstance(vertices, CSRGraph):
+        graph = vertices
+        vertices = graph.num_vertices
+        edges = ((u, v) for u, v, _ in graph.edges() if u <= v)
+    for _ in cycle_edges(edges, vertices, first=True):
+        return True
     return False
 
-# Example Usage
-vertices = 5
-edges = [(0, 1), (1, 2), (2, 0), (3, 4)]  # This graph contains a cycle
-print("Cycle detected in undirected graph:", detect_cycle_undirected(vertices, edges))
+
+# Benchmark: 10M streamed edges from a generator (timing includes generating them),
+# nothing but the DSU in memory
+def benchmark(vertices=1_000_000, num_edges=10_000_000):
+    import random
+    import time
+
+    rng = random.Random(1)
+    stream = ((rng.randrange(vertices), rng.randrange(vertices)) for _ in range(num_edges))
+    detector = CycleDetector()
+    start = time.perf_counter()
+    for u, v in stream:
+        detector.add_edge(u, v)
+    elapsed = time.perf_counter() - start
+    print(f"{num_edges} edges in {elapsed:.2f}s ({num_edges / elapsed:,.0f} edges/s), "
+          f"{detector.cycles} cycle-closing edges, first {detector.first}")
+
+
+# Driver Code
+def main():
+    vertices = 5
+    edges = [(0, 1), (1, 2), (2, 0), (3, 4)]  # This graph contains a cycle
+    print("Cycle detected in undirected graph:", detect_cycle_undirected(vertices, edges))
+
+    # Edges arriving one at a time, with vertex ids not known up front
+    detector = CycleDetector()
+    for u, v in [(0, 1), (1, 2), (7, 8), (2, 0), (8, 9), (9, 7)]:
+        if detector.add_edge(u, v):
+            print(f"Edge {u} - {v} closes a cycle")
+    print("Cycle-closing edges:", list(cycle_edges(iter([(0, 1), (1, 1), (1, 0), (2, 3)]))))
+
+
+if __name__ == "__main__":
+    main()
+    if "--bench" in sys.argv:
+        benchmark()
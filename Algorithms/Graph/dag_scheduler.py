@@ -0,0 +1,237 @@
+'''
+Parallel DAG task scheduler built on Kahn's algorithm.
+
+topological_sorting_bfs_indegree.topological_sort returns one flat order. The same in-degree
+bookkeeping can drive execution instead: a task is submitted to a thread or process pool as
+soon as its in-degree drops to 0, i.e. as soon as all of its dependencies have finished, so
+independent tasks run concurrently and nothing waits for a whole "level" to finish.
+
+An edge (u, v) means task u must finish before task v starts. tasks[v] is a callable taking
+no arguments (for executor="process" it must be picklable, e.g. a module-level function or a
+functools.partial of one).
+
+run_dag returns a ScheduleResult:
+- results[v]: return value of task v (None if it failed or never ran)
+- errors: {v: exception} for the tasks that raised
+- skipped: tasks that never ran because a dependency failed (failures propagate downstream,
+  everything that does not depend on a failed task still runs)
+- start[v], finish[v]: seconds since the schedule started, measured in the worker (a task
+  waiting in the pool queue has not started yet), duration[v] = time spent in the task
+- critical_path: the chain of dependent tasks with the largest total duration, i.e. the lower
+  bound on the makespan with unlimited workers, and critical_time its length
+- makespan: wall time of the whole schedule
+
+levels() gives the static view: the tasks grouped by longest dependency chain, every level
+only depends on earlier ones.
+
+- Time Complexity: O(V + E) scheduling overhead on top of the tasks themselves
+- Space Complexity: O(V + E)
+'''
+
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+
+from csr_graph import as_adjacency
+from topological_sorting_bfs_indegree import topological_sort
+
+
+class ScheduleResult:
+    def __init__(self, vertices):
+        self.results = [None] * vertices
+        self.errors = {}
+        self.skipped = []
+        self.start = [None] * vertices
+        self.finish = [None] * vertices
+        self.duration = [None] * vertices
+        self.critical_path = []
+        self.critical_time = 0.0
+        self.makespan = 0.0
+
+    @property
+    def ok(self):
+        return not self.errors and not self.skipped
+
+
+def _run_task(task):
+    # Runs in the worker: time the task there, and hand exceptions back as values
+    # so the duration of a failed task is still known. The start is wall-clock time,
+    # which (unlike perf_counter) is comparable across processes.
+    started = time.time()
+    start = time.perf_counter()
+    try:
+        return True, task(), started, time.perf_counter() - start
+    except Exception as e:
+        return False, e, started, time.perf_counter() - start
+
+
+def run_dag(vertices, edges, tasks, workers=None, executor="thread"):
+    # Step 1: A cycle is rejected before any task runs (vertices may also be a csr_graph.CSRGraph)
+    edges = None if edges is None else list(edges)  # read twice
+    order = topological_sort(vertices, edges)
+
+    # Build the graph and the in-degrees that release the tasks
+    vertices, adj_list = as_adjacency(vertices, edges)
+    in_degree = _in_degrees(vertices, adj_list)
+
+    if executor == "thread":
+        pool = ThreadPoolExecutor(workers or os.cpu_count())
+    elif executor == "process":
+        pool = ProcessPoolExecutor(workers or os.cpu_count())
+    else:
+        raise ValueError(f"Unknown executor {executor!r}, expected 'thread' or 'process'")
+
+    result = ScheduleResult(vertices)
+    blocked = bytearray(vertices)
+    running = {}
+    t0 = time.perf_counter()
+    t0_wall = time.time()
+
+    def submit(node):
+        running[pool.submit(_run_task, tasks[node])] = node
+
+    def block_downstream(node):
+        # Everything reachable from a failed task is skipped
+        queue = deque([node])
+        while queue:
+            current = queue.popleft()
+            for neighbor in adj_list[current]:
+                if not blocked[neighbor]:
+                    blocked[neighbor] = 1
+                    result.skipped.append(neighbor)
+                    queue.append(neighbor)
+
+    try:
+        # Step 2: Start every task without dependencies
+        for node in range(vertices):
+            if in_degree[node] == 0:
+                submit(node)
+
+        # Step 3: Release tasks as their last dependency finishes
+        while running:
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                node = running.pop(future)
+                success, value, started, elapsed = future.result()
+                result.start[node] = started - t0_wall
+                result.finish[node] = result.start[node] + elapsed
+                result.duration[node] = elapsed
+
+                if not success:
+                    result.errors[node] = value
+                    block_downstream(node)
+                    continue
+                result.results[node] = value
+                for neighbor in adj_list[node]:
+                    in_degree[neighbor] -= 1
+                    if in_degree[neighbor] == 0 and not blocked[neighbor]:
+                        submit(neighbor)
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+    # Step 4: Critical path over the measured durations
+    result.makespan = time.perf_counter() - t0
+    result.skipped.sort()
+    result.critical_path, result.critical_time = _critical_path(order, adj_list, result.duration)
+    return result
+
+
+def _in_degrees(vertices, adj_list):
+    in_degree = [0] * vertices
+    for u in range(vertices):
+        for v in adj_list[u]:
+            in_degree[v] += 1
+    return in_degree
+
+
+def _critical_path(order, adj_list, duration):
+    # Longest path by task durations over the tasks that ran
+    best = [0.0] * len(order)
+    prev = [-1] * len(order)
+    end = -1
+    for node in order:
+        if duration[node] is not None:
+            best[node] += duration[node]
+            if end == -1 or best[node] > best[end]:
+                end = node
+        for neighbor in adj_list[node]:
+            if duration[node] is not None and best[node] > best[neighbor]:
+                best[neighbor] = best[node]
+                prev[neighbor] = node
+
+    path = []
+    node = end
+    while node != -1:
+        path.append(node)
+        node = prev[node]
+    return path[::-1], (best[end] if end != -1 else 0.0)
+
+
+def levels(vertices, edges=None):
+    # Group the vertices by longest dependency chain: level k only depends on levels < k
+    edges = None if edges is None else list(edges)  # read twice
+    order = topological_sort(vertices, edges)
+    vertices, adj_list = as_adjacency(vertices, edges)
+
+    level = [0] * vertices
+    result = []
+    for node in order:
+        if level[node] == len(result):
+            result.append([])
+        result[level[node]].append(node)
+        for neighbor in adj_list[node]:
+            if level[node] + 1 > level[neighbor]:
+                level[neighbor] = level[node] + 1
+    return result
+
+
+def _sleep_task(seconds):
+    time.sleep(seconds)
+    return seconds
+
+
+# Benchmark: a random layered DAG of sleeping tasks, sequential vs 8 and 32 threads
+def benchmark(vertices=400, edges_per_vertex=3, task_time=0.005):
+    import random
+    from functools import partial
+
+    rng = random.Random(1)
+    edges = set()
+    for v in range(1, vertices):
+        for _ in range(edges_per_vertex):
+            edges.add((rng.randrange(max(0, v - 50), v), v))
+    tasks = [partial(_sleep_task, task_time * rng.uniform(0.5, 1.5)) for _ in range(vertices)]
+    print(f"{vertices} tasks, {len(edges)} dependencies, {len(levels(vertices, list(edges)))} levels")
+
+    for workers in (1, 8, 32):
+        result = run_dag(vertices, list(edges), tasks, workers=workers)
+        print(f"{workers:>3} workers: makespan {result.makespan:.2f}s, "
+              f"critical path {len(result.critical_path)} tasks / {result.critical_time:.2f}s")
+
+
+# Driver Code
+def main():
+    from functools import partial
+
+    # 0 -> 2, 1 -> 2, 2 -> 3, 1 -> 4
+    edges = [(0, 2), (1, 2), (2, 3), (1, 4)]
+    print("Levels:", levels(5, edges))
+
+    tasks = [partial(_sleep_task, t) for t in (0.05, 0.01, 0.02, 0.03, 0.01)]
+    result = run_dag(5, edges, tasks, workers=2)
+    print("Results:", result.results)
+    print("Critical path:", result.critical_path, f"({result.critical_time:.2f}s)")
+    print(f"Makespan: {result.makespan:.2f}s")
+
+    # Task 2 fails: 3 depends on it and is skipped, 4 still runs
+    tasks[2] = partial(int, "not a number")
+    result = run_dag(5, edges, tasks, workers=2, executor="process")
+    print("Errors:", result.errors, "skipped:", result.skipped, "results:", result.results)
+
+
+if __name__ == "__main__":
+    main()
+    if "--bench" in sys.argv:
+        benchmark()
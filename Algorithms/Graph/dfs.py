@@ -1,18 +1,25 @@
 from collections import defaultdict
+import traversal
 
 class Graph:
-    def __init__(self):
-        # Initializing Adajency list.
-        self.adj=defaultdict(list)
+    def __init__(self, csr=None):
+        # Initializing Adajency list, or reusing the neighbor
+        # lists of an undirected csr_graph.CSRGraph.
+        self.adj=defaultdict(list) if csr is None else csr.neighbor_view()
+        self.csr=csr
 
     # Function to insert an edge in the graph.
     def insertEdge(self, u, v):
+        # A CSR graph is read-only, its neighbor lists are copies.
+        if self.csr is not None:
+            raise ValueError("Cannot insert edges into a graph built from a CSRGraph")
         # Adding edge from u to v.
         self.adj[u].append(v)
         # Adding edge from v to u.
         self.adj[v].append(u)
 
-    # A helper function for DFS. 
+    # A recursive helper function for DFS, limited
+    # by the recursion depth (~1000 vertices deep).
     def DFS_helper(self, u, visited):
         # Marking u as visited
         visited.add(u)
@@ -29,11 +36,15 @@ class Graph:
                 self.DFS_helper(v, visited)
     
     def DFS(self, u):
-        # Declaring a visited set.
-        visited=set()
-        # Calling DFS_helper function 
-        # with index as u.
-        self.DFS_helper(u,visited)
+        # Iterative traversal with an explicit
+        # stack, same order as DFS_helper.
+        for v in self.DFS_iter(u):
+            print(v)
+
+    # Generator version of DFS, yields vertices lazily.
+    # See traversal.dfs for with_info / visit / stop
+    def DFS_iter(self, u, **options):
+        return traversal.dfs(self.adj, u, **options)
 
         
 g=Graph()        
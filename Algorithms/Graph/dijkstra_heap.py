@@ -6,12 +6,21 @@ It is a type of greedy algorithm. It only works on weighted graphs with positive
 It has a time complexity of O(V^2) using the adjacency matrix representation of graph. 
 The time complexity can be reduced to O((V+E)logV) using adjacency list representation of graph,
 where E is the number of edges in the graph and V is the number of vertices in the graph.
+
+`graph` is either a dict {u: [(v, weight), ...]} or a csr_graph.CSRGraph.
+
+`queue` selects the priority queue: "heapq" (lazy deletion, default) or one of the
+decrease-key backends in priority_queues ("indexed", "pairing", "bucket" for small integer weights).
 '''
 
 import heapq
 from math import inf
+from priority_queues import new_queue, max_edge_weight
+
+def Dijkstra(graph, start, queue="heapq"):
+    if queue != "heapq":
+        return dijkstra_decrease_key(graph, start, queue)
 
-def Dijkstra(graph, start):
     l = len(graph)
     
     # initialize all node distances as infinite
@@ -49,11 +58,39 @@ def Dijkstra(graph, start):
     # now at last return the list which contains the shortest path to each node from that given node
     return dist
 
-graph = {
-    0: [(1, 1)],
-    1: [(0, 1), (2, 2), (3, 3)],
-    2: [(1, 2), (3, 1), (4, 5)],
-    3: [(1, 3), (2, 1), (4, 1)],
-    4: [(2, 5), (3, 1)]
-}
-print(Dijkstra(graph, 0))
+# Dijkstra with an addressable queue: every node is queued at most once and
+# an improved distance lowers its priority in place instead of pushing a new entry
+def dijkstra_decrease_key(graph, start, queue):
+    l = len(graph)
+    dist = [inf for _ in range(l)]
+    dist[start] = 0
+    vis = [False for _ in range(l)]
+
+    max_weight = max_edge_weight(graph) if queue == "bucket" else None
+    pqueue = new_queue(queue, l, max_weight)
+    pqueue.push(start, 0)
+
+    while pqueue:
+        _, u = pqueue.pop()
+        vis[u] = True
+
+        for v, d in graph[u]:
+            if not vis[v] and dist[u] + d < dist[v]:
+                dist[v] = dist[u] + d
+                pqueue.push(v, dist[v])
+
+    return dist
+
+# Driver Code
+def main():
+    graph = {
+        0: [(1, 1)],
+        1: [(0, 1), (2, 2), (3, 3)],
+        2: [(1, 2), (3, 1), (4, 5)],
+        3: [(1, 3), (2, 1), (4, 1)],
+        4: [(2, 5), (3, 1)]
+    }
+    print(Dijkstra(graph, 0))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+'''
+Point-to-point shortest path queries (one source, one target).
+
+dijkstra_heap.Dijkstra settles every reachable vertex. When only dist(source, target) is needed
+there are three standard ways to settle fewer vertices:
+
+1. Early exit: plain Dijkstra that stops as soon as the target is popped from the heap.
+   The target is final at that point, so nothing after it matters.
+
+2. Bidirectional Dijkstra: a forward search from the source and a backward search (over the
+   reversed edges) from the target, alternating. Every time an edge connects the two searches
+   `best` is updated, and the search stops once top(forward) + top(backward) >= best.
+   Two balls of radius d/2 contain far fewer vertices than one ball of radius d.
+
+3. A*: Dijkstra ordered by dist(source, v) + h(v), where h(v) is a lower bound on
+   dist(v, target) (e.g. straight-line distance on a road map). A good h steers the
+   search towards the target; h = 0 is plain Dijkstra.
+
+All three record predecessors, so the path is rebuilt by walking pred[] back from the target.
+Each function returns (distance, path) with (inf, []) when the target is unreachable, and
+stores the number of settled vertices in stats["settled"] if a stats dict is passed.
+
+`graph` is either a dict {u: [(v, weight), ...]} or a csr_graph.CSRGraph.
+
+- Time Complexity: O((V + E) log V) worst case for all three
+- Space Complexity: O(V)
+'''
+
+import heapq
+import sys
+from math import inf
+
+
+def reconstruct_path(pred, source, target):
+    path = [target]
+    while path[-1] != source:
+        path.append(pred[path[-1]])
+    return path[::-1]
+
+
+def dijkstra_target(graph, source, target, stats=None):
+    n = len(graph)
+    dist = [inf] * n
+    pred = [-1] * n
+    vis = [False] * n
+    dist[source] = 0
+    pqueue = [(0, source)]
+    settled = 0
+
+    while pqueue:
+        _, u = heapq.heappop(pqueue)
+        if vis[u]:
+            continue
+        vis[u] = True
+        settled += 1
+
+        # The target is final once it is popped, stop here
+        if u == target:
+            break
+
+        for v, d in graph[u]:
+            if dist[u] + d < dist[v]:
+                dist[v] = dist[u] + d
+                pred[v] = u
+                heapq.heappush(pqueue, (dist[v], v))
+
+    if stats is not None:
+        stats["settled"] = settled
+    if dist[target] == inf:
+        return inf, []
+    return dist[target], reconstruct_path(pred, source, target)
+
+
+def bidirectional_dijkstra(graph, source, target, reverse=None, stats=None):
+    # reverse holds the reversed edges (e.g. CSRGraph.reverse()), None for undirected graphs
+    n = len(graph)
+    graphs = (graph, graph if reverse is None else reverse)
+    dist = ([inf] * n, [inf] * n)
+    pred = ([-1] * n, [-1] * n)
+    vis = ([False] * n, [False] * n)
+    pqueues = ([(0, source)], [(0, target)])
+    dist[0][source] = 0
+    dist[1][target] = 0
+
+    best = 0 if source == target else inf
+    meet = source
+    settled = 0
+
+    while pqueues[0] and pqueues[1]:
+        # Stop once no path through unsettled vertices can beat the best one found so far
+        if pqueues[0][0][0] + pqueues[1][0][0] >= best:
+            break
+
+        # Expand the side with the smaller queue
+        side = 0 if len(pqueues[0]) <= len(pqueues[1]) else 1
+        other = 1 - side
+        _, u = heapq.heappop(pqueues[side])
+        if vis[side][u]:
+            continue
+        vis[side][u] = True
+        settled += 1
+
+        for v, d in graphs[side][u]:
+            if dist[side][u] + d < dist[side][v]:
+                dist[side][v] = dist[side][u] + d
+                pred[side][v] = u
+                heapq.heappush(pqueues[side], (dist[side][v], v))
+            # The edge connects the two searches
+            if dist[side][u] + d + dist[other][v] < best:
+                best = dist[side][u] + d + dist[other][v]
+                meet = v
+
+    if stats is not None:
+        stats["settled"] = settled
+    if best == inf:
+        return inf, []
+
+    # source -> meet from the forward tree, meet -> target from the backward tree
+    path = reconstruct_path(pred[0], source, meet)
+    v = meet
+    while v != target:
+        v = pred[1][v]
+        path.append(v)
+    return best, path
+
+
+def astar(graph, source, target, heuristic, stats=None):
+    # heuristic(v) must never overestimate the remaining distance from v to the target
+    n = len(graph)
+    dist = [inf] * n
+    pred = [-1] * n
+    dist[source] = 0
+    pqueue = [(heuristic(source), 0, source)]
+    settled = 0
+
+    while pqueue:
+        _, g, u = heapq.heappop(pqueue)
+        # Skip stale entries, a shorter g was pushed for u after this one
+        if g > dist[u]:
+            continue
+        settled += 1
+
+        if u == target:
+            break
+
+        for v, d in graph[u]:
+            if g + d < dist[v]:
+                dist[v] = g + d
+                pred[v] = u
+                heapq.heappush(pqueue, (dist[v] + heuristic(v), dist[v], v))
+
+    if stats is not None:
+        stats["settled"] = settled
+    if dist[target] == inf:
+        return inf, []
+    return dist[target], reconstruct_path(pred, source, target)
+
+
+def grid_graph(rows, cols, seed=1):
+    # Road-like test graph: a grid with random weights >= the Manhattan step length (1)
+    import random
+
+    rng = random.Random(seed)
+    graph = {v: [] for v in range(rows * cols)}
+    for r in range(rows):
+        for c in range(cols):
+            u = r * cols + c
+            for v in ((u + 1) if c + 1 < cols else None, (u + cols) if r + 1 < rows else None):
+                if v is not None:
+                    w = rng.randint(1, 10)
+                    graph[u].append((v, w))
+                    graph[v].append((u, w))
+    return graph
+
+
+# Benchmark: settled vertices and time of each query mode vs the full single-source run
+def benchmark(rows=300, cols=300, queries=20):
+    import random
+    import time
+    from dijkstra_heap import Dijkstra
+
+    graph = grid_graph(rows, cols)
+    rng = random.Random(2)
+    pairs = [(rng.randrange(rows * cols), rng.randrange(rows * cols)) for _ in range(queries)]
+
+    def manhattan_to(t):
+        tr, tc = divmod(t, cols)
+        return lambda v: abs(v // cols - tr) + abs(v % cols - tc)
+
+    modes = {
+        "full Dijkstra": lambda s, t, st: (st.update(settled=rows * cols), Dijkstra(graph, s)[t]),
+        "early exit": lambda s, t, st: dijkstra_target(graph, s, t, st),
+        "bidirectional": lambda s, t, st: bidirectional_dijkstra(graph, s, t, stats=st),
+        "A* (manhattan)": lambda s, t, st: astar(graph, s, t, manhattan_to(t), st),
+    }
+    print(f"{rows}x{cols} grid, {queries} random queries")
+    print(f"{'mode':<16}{'avg settled':>12}{'ms/query':>10}")
+    for name, query in modes.items():
+        settled = 0
+        start = time.perf_counter()
+        for s, t in pairs:
+            stats = {}
+            query(s, t, stats)
+            settled += stats["settled"]
+        elapsed = (time.perf_counter() - start) * 1000 / queries
+        print(f"{name:<16}{settled // queries:>12}{elapsed:>10.1f}")
+
+
+# Driver Code
+def main():
+    graph = {
+        0: [(1, 1)],
+        1: [(0, 1), (2, 2), (3, 3)],
+        2: [(1, 2), (3, 1), (4, 5)],
+        3: [(1, 3), (2, 1), (4, 1)],
+        4: [(2, 5), (3, 1)]
+    }
+    stats = {}
+    print("Early exit:", dijkstra_target(graph, 0, 4, stats), "settled", stats["settled"])
+    print("Bidirectional:", bidirectional_dijkstra(graph, 0, 4, stats=stats), "settled", stats["settled"])
+    print("A* (h = 0):", astar(graph, 0, 4, lambda v: 0, stats), "settled", stats["settled"])
+
+
+if __name__ == "__main__":
+    main()
+    if "--bench" in sys.argv:
+        benchmark()
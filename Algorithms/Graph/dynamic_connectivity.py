@@ -0,0 +1,164 @@
+'''
+Offline dynamic connectivity: answer connectivity queries over a timeline of undirected
+edge insertions and deletions, all known in advance.
+
+A DSU can merge sets but never split them, so deletions are the hard part. Offline they
+can be avoided altogether:
+1. Number the queries 0..q-1. Every edge is present on one interval [added, removed) of
+   query positions (or until the end, if it is never removed).
+2. Insert each interval into a segment tree over the query positions; it lands on
+   O(log q) nodes.
+3. Walk the segment tree depth first with a union_find.RollbackDSU: entering a node unions
+   its edges, a leaf answers its query, leaving the node rolls those unions back. On the way
+   down to a leaf exactly the edges alive at that query have been unioned.
+
+Operations are tuples:
+- ("add", u, v) / ("remove", u, v): insert / delete the undirected edge u - v
+  (parallel edges are fine, each "remove" deletes one copy)
+- ("query", u, v): are u and v connected right now? -> bool
+- ("count",): number of connected components right now -> int
+
+dynamic_connectivity returns the answers of the queries, in order.
+
+- Time Complexity: O(n + (m + q) log q log n) for m edge insertions and q queries
+- Space Complexity: O(n + m log q)
+'''
+
+import sys
+
+from union_find import RollbackDSU
+
+
+def dynamic_connectivity(vertices, operations):
+    # Step 1: Active interval [start, end) of query positions for every inserted edge
+    queries = []
+    intervals = []
+    open_edges = {}
+    for op in operations:
+        kind = op[0]
+        if kind == "query" or kind == "count":
+            queries.append(op)
+            continue
+        if kind not in ("add", "remove"):
+            raise ValueError(f"Unknown operation {kind!r}, expected 'add', 'remove', 'query' or 'count'")
+        u, v = op[1], op[2]
+        key = (u, v) if u <= v else (v, u)
+        if kind == "add":
+            open_edges.setdefault(key, []).append(len(queries))
+        else:
+            starts = open_edges.get(key)
+            if not starts:
+                raise ValueError(f"Cannot remove edge {u} - {v}, it is not in the graph")
+            intervals.append((starts.pop(), len(queries), key))
+    q = len(queries)
+    for key, starts in open_edges.items():
+        intervals.extend((start, q, key) for start in starts)
+    if q == 0:
+        return []
+
+    # Step 2: Segment tree over the query positions, node i covers [lo, hi)
+    size = 1
+    while size < q:
+        size *= 2
+    tree = [[] for _ in range(2 * size)]
+    for start, end, key in intervals:
+        # Bottom-up decomposition of [start, end) into canonical nodes
+        lo, hi = start + size, end + size
+        while lo < hi:
+            if lo & 1:
+                tree[lo].append(key)
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                tree[hi].append(key)
+            lo //= 2
+            hi //= 2
+
+    # Step 3: Depth-first walk with an explicit stack, union on entry, rollback on exit
+    dsu = RollbackDSU(vertices)
+    answers = [None] * q
+    stack = [(1, None)]
+    while stack:
+        node, snapshot = stack.pop()
+        if snapshot is not None:
+            dsu.rollback(snapshot)
+            continue
+        # Subtrees whose first leaf is past the last query have nothing to answer
+        first = (node << (size.bit_length() - node.bit_length())) - size
+        if first >= q:
+            continue
+        stack.append((node, dsu.snapshot()))
+        for u, v in tree[node]:
+            dsu.union(u, v)
+        if node >= size:
+            op = queries[first]
+            answers[first] = dsu.connected(op[1], op[2]) if op[0] == "query" else dsu.count
+        else:
+            stack.append((2 * node + 1, None))
+            stack.append((2 * node, None))
+    return answers
+
+
+# Benchmark: segment tree over time vs rebuilding a DSU for every query
+def benchmark(vertices=20_000, num_operations=40_000):
+    import random
+    import time
+    from union_find import DSU
+
+    rng = random.Random(1)
+    edges = []
+    operations = []
+    for _ in range(num_operations):
+        r = rng.random()
+        if r < 0.5 or not edges:
+            edge = (rng.randrange(vertices), rng.randrange(vertices))
+            edges.append(edge)
+            operations.append(("add",) + edge)
+        elif r < 0.75:
+            edge = edges.pop(rng.randrange(len(edges)))
+            operations.append(("remove",) + edge)
+        else:
+            operations.append(("query", rng.randrange(vertices), rng.randrange(vertices)))
+
+    start = time.perf_counter()
+    answers = dynamic_connectivity(vertices, operations)
+    print(f"{num_operations} operations, {len(answers)} queries")
+    print(f"offline segment tree: {time.perf_counter() - start:.2f}s")
+
+    start = time.perf_counter()
+    current = []
+    expected = []
+    for op in operations:
+        if op[0] == "add":
+            current.append(op[1:])
+        elif op[0] == "remove":
+            current.remove(op[1:])
+        else:
+            dsu = DSU(vertices)
+            dsu.union_many(current)
+            expected.append(dsu.find(op[1]) == dsu.find(op[2]))
+    print(f"DSU rebuilt per query: {time.perf_counter() - start:.2f}s")
+    assert answers == expected
+
+
+# Driver Code
+def main():
+    operations = [
+        ("add", 0, 1),
+        ("add", 1, 2),
+        ("query", 0, 2),
+        ("count",),
+        ("remove", 0, 1),
+        ("query", 0, 2),
+        ("add", 3, 0),
+        ("add", 3, 2),
+        ("query", 0, 2),
+        ("count",)
+    ]
+    print("Answers:", dynamic_connectivity(5, operations))
+
+
+if __name__ == "__main__":
+    main()
+    if "--bench" in sys.argv:
+        benchmark()
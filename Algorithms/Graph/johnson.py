@@ -0,0 +1,68 @@
+'''
+Johnson's algorithm: all-pairs shortest paths on sparse graphs with negative edges.
+
+Running Bellman-Ford from every vertex costs O(V^2 * E). Johnson runs it once:
+1. Add a virtual vertex q with a 0-weight edge to every vertex and run Bellman-Ford from q.
+   h[v] = dist(q, v) is a "potential"; a negative cycle raises NegativeCycleError here.
+2. Reweight every edge: w'(u, v) = w(u, v) + h[u] - h[v]. By the triangle inequality
+   w' >= 0, and every u -> v path changes by the same h[u] - h[v], so shortest paths stay shortest.
+3. Run Dijkstra from every vertex on the reweighted graph. This phase is embarrassingly
+   parallel and goes through distance_matrix, i.e. a process pool over a shared-memory CSR graph.
+4. Undo the reweighting: dist(u, v) = dist'(u, v) - h[u] + h[v] (done by the workers).
+
+The V x V result is written into a preallocated shared block, or into a memory-mapped file
+when `out` is a path, so V large enough that the matrix does not fit in RAM still works.
+
+- Time Complexity: O(V * E + V * (V + E) log V)
+- Space Complexity: O(V^2) for the result
+'''
+
+from bellman_ford import Edge, bellman_ford
+from csr_graph import CSRGraph
+from distance_matrix import distance_matrix
+
+
+def johnson(vertices, edges, workers=None, out=None, mode="spfa"):
+    # edges is a list of bellman_ford.Edge, mode is the Bellman-Ford mode of step 1
+    # Step 1: Potentials from a virtual source connected to every vertex
+    # (raises bellman_ford.NegativeCycleError with the offending cycle)
+    virtual = vertices
+    h = bellman_ford(vertices + 1, edges + [Edge(virtual, v, 0) for v in range(vertices)], virtual, mode)
+
+    # Step 2: Non-negative reweighted graph
+    reweighted = CSRGraph.from_edges(vertices, [
+        (e.source, e.destination, e.weight + h[e.source] - h[e.destination]) for e in edges
+    ], weighted=True)
+
+    # Step 3 + 4: Dijkstra from every vertex, un-reweighted by the workers
+    return distance_matrix(reweighted, list(range(vertices)), workers=workers, out=out,
+                           potential=list(h[:vertices]))
+
+
+# Driver Code
+def main():
+    edges = [
+        Edge(0, 1, -5),
+        Edge(0, 2, 2),
+        Edge(0, 3, 3),
+        Edge(1, 2, 4),
+        Edge(2, 3, 1),
+        Edge(3, 1, 2)
+    ]
+    matrix = johnson(4, edges, workers=2)
+    print("All-pairs shortest distances:")
+    for i in range(matrix.rows):
+        print(i, list(matrix.row(i)))
+
+    try:
+        johnson(2, [Edge(0, 1, 1), Edge(1, 0, -2)], workers=1)
+    except ValueError as e:
+        print(e)
+
+    # No edges: every vertex only reaches itself
+    matrix = johnson(3, [], workers=2)
+    print("Without edges:", [list(matrix.row(i)) for i in range(matrix.rows)])
+
+
+if __name__ == "__main__":
+    main()
@@ -11,33 +11,11 @@ Adjacency List Representation:
 - Space Complexity: O(V + E)
 '''
 
-class UnionFind:
-    def __init__(self, n):
-        self.parent = [i for i in range(n)]
-        self.rank = [0] * n
-
-    def find(self, u):
-        if self.parent[u] != u:
-            self.parent[u] = self.find(self.parent[u])  # Path compression
-        return self.parent[u]
-
-    def union(self, u, v):
-        root_u = self.find(u)
-        root_v = self.find(v)
-
-        if root_u != root_v:
-            if self.rank[root_u] > self.rank[root_v]:
-                self.parent[root_v] = root_u
-            elif self.rank[root_u] < self.rank[root_v]:
-                self.parent[root_u] = root_v
-            else:
-                self.parent[root_v] = root_u
-                self.rank[root_u] += 1
+from union_find import DSU as UnionFind
 
 def kruskal(vertices, edges):
-    # Step 1: Sort edges by weight
-    edges.sort(key=lambda x: x[2])
-    print(edges)
+    # Step 1: Sort edges by weight (into a new list, the caller's list is left as is)
+    edges = sorted(edges, key=lambda x: x[2])
 
     # Step 2: Initialize Union-Find and MST result
     uf = UnionFind(vertices)
@@ -46,8 +24,7 @@ def kruskal(vertices, edges):
 
     # Step 3: Process edges
     for u, v, weight in edges:
-        if uf.find(u) != uf.find(v):
-            uf.union(u, v)
+        if uf.union(u, v):
             mst.append((u, v, weight))
             mst_cost += weight
 
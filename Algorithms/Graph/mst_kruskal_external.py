@@ -0,0 +1,192 @@
+'''
+External-memory Kruskal for edge lists larger than RAM.
+
+mst_kruskal.kruskal needs the whole edge list as Python tuples to sort it. Here the edges
+stay on disk and only O(V) state (the union-find) plus one chunk is in memory at a time:
+
+1. Run formation: read the edge file in chunks of `chunk_size` edges, sort each chunk by
+   weight and write it to a temporary binary "run" file.
+2. k-way merge: heapq.merge lazily merges the sorted runs, holding one buffered block per run.
+   At most `fan_in` runs are open at once: with more runs, groups of fan_in runs are first
+   merged into longer runs on disk, pass by pass, until fan_in or fewer are left. The block
+   size is chosen so that fan_in blocks fit in `merge_memory` bytes.
+3. Kruskal: the merged stream is already in weight order, so it goes straight into
+   union-find, and stops as soon as the MST has V - 1 edges.
+
+Edge files are either CSV lines "u,v,weight" or binary records of
+(int32 u, int32 v, float64 weight), little-endian, 16 bytes each.
+
+- Time Complexity: O(E log E) comparisons, O((E / B) * log_fan_in(E / chunk_size)) sequential
+  reads and writes of blocks of B edges
+- Space Complexity: O(V + chunk_size + merge_memory) memory, at most fan_in + 1 open run files,
+  O(E) temporary disk
+'''
+
+import csv
+import heapq
+import os
+import struct
+import sys
+import tempfile
+
+from union_find import DSU
+
+RECORD = struct.Struct("<iid")
+
+
+def write_binary_edges(path, edges):
+    with open(path, "wb") as f:
+        for u, v, w in edges:
+            f.write(RECORD.pack(u, v, w))
+
+
+def read_edges(path, chunk_size=1_000_000, fmt=None):
+    # Yield lists of (u, v, weight) with at most chunk_size edges
+    fmt = fmt or ("csv" if path.endswith((".csv", ".txt")) else "binary")
+    if fmt == "binary":
+        with open(path, "rb") as f:
+            while True:
+                block = f.read(RECORD.size * chunk_size)
+                if not block:
+                    return
+                yield list(RECORD.iter_unpack(block))
+    elif fmt == "csv":
+        with open(path, newline="") as f:
+            chunk = []
+            for row in csv.reader(f):
+                if not row or row[0].startswith("#"):
+                    continue
+                chunk.append((int(row[0]), int(row[1]), float(row[2])))
+                if len(chunk) == chunk_size:
+                    yield chunk
+                    chunk = []
+            if chunk:
+                yield chunk
+    else:
+        raise ValueError(f"Unknown edge file format {fmt!r}, expected 'csv' or 'binary'")
+
+
+def _sorted_runs(path, chunk_size, fmt, workdir):
+    runs = []
+    for i, chunk in enumerate(read_edges(path, chunk_size, fmt)):
+        chunk.sort(key=lambda x: x[2])
+        run = os.path.join(workdir, f"run{i}.bin")
+        write_binary_edges(run, chunk)
+        runs.append(run)
+    return runs
+
+
+def _read_run(path, block_edges=65536):
+    # Stream one sorted run back in blocks
+    with open(path, "rb") as f:
+        while True:
+            block = f.read(RECORD.size * block_edges)
+            if not block:
+                return
+            yield from RECORD.iter_unpack(block)
+
+
+def _merge_runs(runs, workdir, fan_in, block_edges):
+    # Merge groups of fan_in runs into longer runs until at most fan_in are left
+    passes = 0
+    while len(runs) > fan_in:
+        merged_runs = []
+        for i in range(0, len(runs), fan_in):
+            group = runs[i:i + fan_in]
+            if len(group) == 1:
+                merged_runs.append(group[0])
+                continue
+            run = os.path.join(workdir, f"merge{passes}_{i // fan_in}.bin")
+            merged = heapq.merge(*(_read_run(r, block_edges) for r in group), key=lambda x: x[2])
+            write_binary_edges(run, merged)
+            for r in group:
+                os.remove(r)
+            merged_runs.append(run)
+        runs = merged_runs
+        passes += 1
+    return runs
+
+
+def kruskal_external(vertices, path, chunk_size=1_000_000, fmt=None, tmp_dir=None, fan_in=64,
+                     merge_memory=64 * 2**20):
+    if fan_in < 2:
+        raise ValueError("fan_in must be at least 2")
+    # Read buffer per open run, so that fan_in of them fit in merge_memory
+    block_edges = max(1, merge_memory // (fan_in * RECORD.size))
+
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as workdir:
+        # Step 1: Sorted runs on disk
+        runs = _sorted_runs(path, chunk_size, fmt, workdir)
+
+        # Step 2: k-way merge of the runs in weight order, at most fan_in at a time
+        runs = _merge_runs(runs, workdir, fan_in, block_edges)
+        merged = heapq.merge(*(_read_run(run, block_edges) for run in runs), key=lambda x: x[2])
+
+        # Step 3: Kruskal over the merged stream
+        uf = DSU(vertices)
+        mst = []
+        mst_cost = 0
+        for u, v, weight in merged:
+            if uf.union(u, v):
+                mst.append((u, v, weight))
+                mst_cost += weight
+                if len(mst) == vertices - 1:
+                    break
+        merged.close()
+
+    return mst, mst_cost
+
+
+# Benchmark: external Kruskal vs in-memory Kruskal on a random binary edge file
+def benchmark(vertices=100_000, num_edges=2_000_000, chunk_size=250_000):
+    import random
+    import time
+    from mst_kruskal import kruskal
+
+    rng = random.Random(1)
+    edges = [(rng.randrange(vertices), rng.randrange(vertices), float(rng.randint(1, 10**6)))
+             for _ in range(num_edges)]
+    edges += [(v, v + 1, 2e6) for v in range(vertices - 1)]
+    path = os.path.join(tempfile.mkdtemp(), "edges.bin")
+    write_binary_edges(path, edges)
+
+    start = time.perf_counter()
+    _, expected = kruskal(vertices, edges)
+    print(f"in-memory kruskal: {time.perf_counter() - start:.2f}s")
+    del edges
+
+    start = time.perf_counter()
+    _, cost = kruskal_external(vertices, path, chunk_size)
+    print(f"external kruskal ({chunk_size} edges per run): {time.perf_counter() - start:.2f}s")
+    assert cost == expected
+    os.remove(path)
+
+
+# Driver Code
+def main():
+    edges = [
+        (0, 1, 4),
+        (0, 2, 4),
+        (1, 2, 2),
+        (1, 0, 4),
+        (2, 3, 3),
+        (2, 5, 2),
+        (2, 4, 4),
+        (3, 4, 3),
+        (5, 4, 3)
+    ]
+    path = os.path.join(tempfile.mkdtemp(), "edges.csv")
+    with open(path, "w", newline="") as f:
+        csv.writer(f).writerows(edges)
+
+    # Tiny chunks and fan-in to force several runs and a multi-pass merge
+    mst, mst_cost = kruskal_external(6, path, chunk_size=2, fan_in=2)
+    print("Minimum Spanning Tree:", mst)
+    print("Total Cost of MST:", mst_cost)
+    os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
+    if "--bench" in sys.argv:
+        benchmark()
@@ -0,0 +1,198 @@
+'''
+Two MST algorithms that avoid Kruskal's single sequential pass over all sorted edges.
+
+Boruvka:
+Every round, each component picks its cheapest outgoing edge, and all of those edges are
+added at once (they are all in the MST when ties are broken consistently). The number of
+components at least halves per round, so there are O(log V) rounds.
+- The edges are sorted once by (weight, index), so "cheapest edge of a component" is simply
+  "smallest position", found for all components at once with np.minimum.at.
+- Edges inside a component are dropped after every round, so rounds get cheaper.
+- With workers > 1, the per-component minimum is computed over slices of the edge arrays in a
+  process pool; edges and component labels live in shared memory, workers return only
+  (component, best position) pairs.
+
+Filter-Kruskal (Osipov, Sanders, Singler):
+Quicksort-like: split the edges around a random pivot weight, solve the light half first,
+then throw away every heavy edge whose endpoints are already connected before recursing on
+it. On dense graphs most heavy edges are filtered out without ever being sorted.
+
+Both take the same (vertices, [(u, v, weight), ...]) input as mst_kruskal.kruskal and return
+(mst_edges, cost).
+
+- Boruvka Time Complexity: O(E log V)
+- Filter-Kruskal Time Complexity: O(E + V log V log(E / V)) expected
+'''
+
+import os
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from shared_arrays import init_worker, release, share, worker_arrays
+from union_find import DSU
+
+
+def boruvka(vertices, edges, workers=1):
+    if not edges:
+        return [], 0
+    data = np.array(edges, dtype=np.float64)
+    order = np.lexsort((np.arange(len(edges)), data[:, 2]))
+    arrays = {
+        "u": data[order, 0].astype(np.int64),
+        "v": data[order, 1].astype(np.int64),
+        "comp": np.arange(vertices, dtype=np.int64),
+    }
+    edge_ids = order  # position in the sorted arrays -> index in the caller's list
+
+    pool, blocks = None, []
+    if workers > 1:
+        arrays, blocks, specs = share(arrays)
+        pool = ProcessPoolExecutor(workers, initializer=init_worker, initargs=(specs,))
+
+    try:
+        u, v, comp = arrays["u"], arrays["v"], arrays["comp"]
+        m = len(edge_ids)
+        mst = []
+        while True:
+            # Step 1: Cheapest edge position per component
+            if pool is None:
+                comps, best = _component_minima(u[:m], v[:m], comp, 0)
+            else:
+                bounds = np.linspace(0, m, workers + 1).astype(np.int64)
+                parts = list(pool.map(_worker_minima, zip(bounds[:-1].tolist(), bounds[1:].tolist())))
+                comps = np.concatenate([p[0] for p in parts])
+                best = np.concatenate([p[1] for p in parts])
+            if len(comps) == 0:
+                break
+            best_of = np.full(vertices, m, dtype=np.int64)
+            np.minimum.at(best_of, comps, best)
+            active = np.flatnonzero(best_of < m)
+            pos = best_of[active]
+
+            # Step 2: Hook every component onto the component at the other end of its edge.
+            # With unique edge positions the only cycles are pairs that picked the same edge,
+            # the smaller label of each pair becomes the root.
+            ends_u = comp[u[pos]]
+            other = np.where(ends_u == active, comp[v[pos]], ends_u)
+            parent = np.arange(vertices, dtype=np.int64)
+            parent[active] = other
+            pair_root = (parent[other] == active) & (active < other)
+            parent[active[pair_root]] = active[pair_root]
+            mst.extend(edges[i] for i in edge_ids[pos[~pair_root]].tolist())
+
+            # Pointer jumping flattens the hooked trees, then every vertex takes its root's label
+            while True:
+                grand = parent[parent]
+                if np.array_equal(grand, parent):
+                    break
+                parent = grand
+            comp[:] = parent[comp]
+
+            # Step 3: Keep only edges between different components (stable, stays sorted)
+            keep = comp[u[:m]] != comp[v[:m]]
+            m_new = int(keep.sum())
+            u[:m_new], v[:m_new] = u[:m][keep], v[:m][keep]
+            edge_ids = edge_ids[:m][keep]
+            m = m_new
+            if m == 0:
+                break
+    finally:
+        if pool is not None:
+            pool.shutdown()
+        release(blocks)
+
+    return mst, sum(w for _, _, w in mst)
+
+
+def filter_kruskal(vertices, edges, threshold=1024, seed=0):
+    uf = DSU(vertices)
+    mst = []
+    rng = random.Random(seed)
+
+    def solve(part):
+        # Small inputs: plain Kruskal
+        if len(part) <= threshold:
+            for u, v, w in sorted(part, key=lambda x: x[2]):
+                if uf.union(u, v):
+                    mst.append((u, v, w))
+            return
+        pivot = rng.choice(part)[2]
+        light = [e for e in part if e[2] < pivot]
+        heavy = [e for e in part if e[2] > pivot]
+        solve(light)
+        # Edges equal to the pivot are already in order
+        for u, v, w in part:
+            if w == pivot and uf.union(u, v):
+                mst.append((u, v, w))
+        # Filter: edges inside an existing component can never join the MST
+        solve([e for e in heavy if uf.find(e[0]) != uf.find(e[1])])
+
+    solve(list(edges))
+    return mst, sum(w for _, _, w in mst)
+
+
+def _component_minima(u, v, comp, offset):
+    # For a slice of sorted edges: (component, smallest position) over both endpoints' components
+    cu, cv = comp[u], comp[v]
+    cross = np.flatnonzero(cu != cv)
+    none = np.iinfo(np.int64).max
+    best = np.full(len(comp), none, dtype=np.int64)
+    np.minimum.at(best, cu[cross], cross)
+    np.minimum.at(best, cv[cross], cross)
+    comps = np.flatnonzero(best != none)
+    return comps, best[comps] + offset
+
+
+def _worker_minima(bounds):
+    lo, hi = bounds
+    return _component_minima(worker_arrays["u"][lo:hi], worker_arrays["v"][lo:hi], worker_arrays["comp"], lo)
+
+
+# Benchmark: Kruskal vs Boruvka vs Filter-Kruskal on a dense and a sparse random graph
+def benchmark():
+    import time
+    from mst_kruskal import kruskal
+
+    for vertices, num_edges in ((200_000, 1_000_000), (5_000, 1_000_000)):
+        rng = random.Random(1)
+        edges = [(rng.randrange(vertices), rng.randrange(vertices), rng.randint(1, 10**6))
+                 for _ in range(num_edges)]
+        print(f"{vertices} vertices, {num_edges} edges")
+        expected = None
+        for name, run in (("kruskal", lambda: kruskal(vertices, edges)),
+                          ("boruvka", lambda: boruvka(vertices, edges)),
+                          ("boruvka x" + str(max(os.cpu_count(), 2)), lambda: boruvka(vertices, edges, max(os.cpu_count(), 2))),
+                          ("filter-kruskal", lambda: filter_kruskal(vertices, edges))):
+            start = time.perf_counter()
+            _, cost = run()
+            print(f"  {name:<15}{time.perf_counter() - start:6.2f}s")
+            expected = cost if expected is None else expected
+            assert cost == expected
+
+
+# Driver Code
+def main():
+    vertices = 6
+    edges = [
+        (0, 1, 4),
+        (0, 2, 4),
+        (1, 2, 2),
+        (1, 0, 4),
+        (2, 3, 3),
+        (2, 5, 2),
+        (2, 4, 4),
+        (3, 4, 3),
+        (5, 4, 3)
+    ]
+    print("Boruvka:", boruvka(vertices, edges))
+    print("Boruvka, 2 workers:", boruvka(vertices, edges, workers=2))
+    print("Filter-Kruskal:", filter_kruskal(vertices, edges, threshold=2))
+
+
+if __name__ == "__main__":
+    main()
+    if "--bench" in sys.argv:
+        benchmark()
@@ -3,12 +3,48 @@ Prim's Algorithm is a greedy approach,
 which includes selecting minimum weight edges and expanding MST from a starting vertex, choosing nearest vertices.
 
 Kruskal does sorting on edges, so if the graph is dense, Prim's algo is better
+
+`graph` is either a dict {u: [(v, weight), ...]} or an undirected csr_graph.CSRGraph.
+
+`queue` selects the priority queue: "heapq" (lazy deletion, default) or one of the
+decrease-key backends in priority_queues ("indexed", "pairing", "bucket" for small integer weights).
+
+Dense graphs: with E close to V^2 the heap versions cost O(V^2 log V), while the textbook
+array version is O(V^2): keep key[v] = cheapest edge from the tree to v for all v, pick the
+argmin, and update key with the new vertex's matrix row. With NumPy both steps are one
+vectorized operation per vertex.
+- `graph` may also be a V x V NumPy adjacency matrix (np.inf or, for integer matrices, NO_EDGE
+  marks a missing edge), which always uses the dense version
+- queue="dense" converts an adjacency list to a matrix and runs the dense version
+- queue="auto" picks "dense" for a CSRGraph with E >= DENSE_RATIO * V^2 and "indexed" otherwise.
+  benchmark() puts the crossover around 2% density; a dict adjacency is never converted, since
+  flattening its Python lists already costs more than the indexed heap run
 '''
 
 import heapq
+import sys
+from math import inf
+from priority_queues import new_queue, max_edge_weight
+
+try:
+    import numpy as np
+    NO_EDGE = np.iinfo(np.int64).max
+except ImportError:
+    np = None
+
+DENSE_RATIO = 0.02
+
+def prim(graph, start=0, queue="heapq"):
+    if np is not None and isinstance(graph, np.ndarray):
+        return prim_dense(graph, start)
+    if queue == "auto":
+        vectorized = np is not None and hasattr(graph, "as_numpy")
+        queue = "dense" if vectorized and graph.num_edges >= DENSE_RATIO * len(graph) ** 2 else "indexed"
+    if queue == "dense":
+        return prim_dense(adjacency_matrix(graph), start)
+    if queue != "heapq":
+        return prim_decrease_key(graph, start, queue)
 
-def prim(graph, start=0):
-    
     # The priority queue to select the edge with the smallest weight
     min_heap = [(0, start, -1)]  # (weight, node, previous_node)
     mst_set = set()  # To keep track of nodes included in the MST
@@ -37,14 +73,142 @@ def prim(graph, start=0):
 
     return mst_edges, total_weight
 
-# Example usage
-graph = {
-    0: [(1, 4), (2, 3)],
-    1: [(0, 4), (2, 1), (3, 2)],
-    2: [(0, 3), (1, 1), (3, 4)],
-    3: [(1, 2), (2, 4)]
-}
-
-mst_edges, total_weight = prim(graph, start=0)
-print("Edges in MST:", mst_edges)
-print("Total weight of MST:", total_weight)
+# Prim with an addressable queue: every node is queued once with the weight of the
+# cheapest edge connecting it to the MST so far, lowered in place when a cheaper edge shows up
+def prim_decrease_key(graph, start, queue):
+    n = len(graph)
+    best = [inf] * n  # cheapest known edge into each node
+    parent = [-1] * n  # other end of that edge
+    in_mst = [False] * n
+    mst_edges = []
+    total_weight = 0
+
+    max_weight = max_edge_weight(graph) if queue == "bucket" else None
+    pqueue = new_queue(queue, n, max_weight)
+    best[start] = 0
+    pqueue.push(start, 0)
+
+    while pqueue:
+        weight, node = pqueue.pop()
+        in_mst[node] = True
+        total_weight += weight
+        if parent[node] != -1:
+            mst_edges.append((parent[node], node, weight))
+
+        for neighbor, edge_weight in graph[node]:
+            if not in_mst[neighbor] and edge_weight < best[neighbor]:
+                best[neighbor] = edge_weight
+                parent[neighbor] = node
+                pqueue.push(neighbor, edge_weight)
+
+    return mst_edges, total_weight
+
+# O(V^2) Prim over an adjacency matrix, one vectorized argmin and one row update per vertex
+def prim_dense(matrix, start=0):
+    n = len(matrix)
+    missing = np.inf if matrix.dtype.kind == 'f' else NO_EDGE
+    key = matrix[start].copy()  # cheapest edge from the tree to each node
+    parent = np.full(n, start)
+    in_mst = np.zeros(n, dtype=bool)
+    in_mst[start] = True
+    key[start] = missing
+    mst_edges = []
+    total_weight = 0
+
+    for _ in range(n - 1):
+        # Closest node outside the tree (nodes inside are kept at `missing`)
+        node = int(np.argmin(key))
+        if key[node] == missing:
+            break  # the rest is not reachable from start
+        weight = key[node].item()
+        mst_edges.append((int(parent[node]), node, weight))
+        total_weight += weight
+        in_mst[node] = True
+
+        # Relax with the new node's row
+        row = matrix[node]
+        closer = (row < key) & ~in_mst
+        key[closer] = row[closer]
+        parent[closer] = node
+        key[node] = missing
+
+    return mst_edges, total_weight
+
+def count_edges(graph):
+    if hasattr(graph, "num_edges"):
+        return graph.num_edges
+    return sum(len(graph[u]) for u in range(len(graph)))
+
+def adjacency_matrix(graph):
+    # V x V matrix of a {u: [(v, weight)]} dict or CSRGraph, keeping integer weights integral
+    n = len(graph)
+    if hasattr(graph, "as_numpy"):
+        offsets, targets, weights = graph.as_numpy()
+        src = np.repeat(np.arange(n), np.diff(offsets))
+        if weights is None:
+            # Unweighted CSR graph: every edge weighs 1, like graph[u] yields
+            weights = np.ones(len(targets), dtype=np.int64)
+    else:
+        src = np.fromiter((u for u in range(n) for _ in graph[u]), dtype=np.int64)
+        targets = np.fromiter((v for u in range(n) for v, _ in graph[u]), dtype=np.int64)
+        weights = np.array([w for u in range(n) for _, w in graph[u]])
+    integral = weights.dtype.kind in "iu"
+    matrix = np.full((n, n), NO_EDGE if integral else np.inf, dtype=np.int64 if integral else np.float64)
+    # Parallel edges keep the lightest weight
+    np.minimum.at(matrix, (src, targets), weights)
+    return matrix
+
+# Benchmark: dense vs indexed heap vs heapq as the edge density grows
+def benchmark(vertices=1500):
+    import random
+    import time
+    from csr_graph import CSRGraph
+
+    print(f"{vertices} vertices")
+    print(f"{'density':>8}{'edges':>10}{'matrix':>8}{'csr>dense':>10}{'dict>dense':>11}{'indexed':>9}{'heapq':>8}")
+    for density in (0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.3, 1.0):
+        rng = random.Random(1)
+        graph = {u: [] for u in range(vertices)}
+        for u in range(vertices):
+            graph[u].append(((u + 1) % vertices, 1000))  # ring, keeps the graph connected
+        pairs = int(density * vertices * (vertices - 1) / 2)
+        for _ in range(pairs):
+            u, v, w = rng.randrange(vertices), rng.randrange(vertices), rng.randint(1, 999)
+            graph[u].append((v, w))
+            graph[v].append((u, w))
+        for u in range(vertices):
+            graph[(u + 1) % vertices].append((u, 1000))
+
+        # "matrix" runs on a prebuilt matrix, the "> dense" columns include the conversion
+        csr = CSRGraph.from_adjacency(graph)
+        runs = (("matrix", adjacency_matrix(graph), None), ("csr>dense", csr, "dense"),
+                ("dict>dense", graph, "dense"), ("indexed", graph, "indexed"), ("heapq", graph, "heapq"))
+        row = f"{density:>8}{count_edges(graph):>10}"
+        costs = set()
+        for name, data, queue in runs:
+            start = time.perf_counter()
+            costs.add(prim(data, 0, queue)[1])
+            row += f"{time.perf_counter() - start:>{len(name) + 1 if len(name) > 7 else 8}.2f}"
+        assert len(costs) == 1
+        print(row)
+
+# Driver Code
+def main():
+    graph = {
+        0: [(1, 4), (2, 3)],
+        1: [(0, 4), (2, 1), (3, 2)],
+        2: [(0, 3), (1, 1), (3, 4)],
+        3: [(1, 2), (2, 4)]
+    }
+
+    mst_edges, total_weight = prim(graph, start=0)
+    print("Edges in MST:", mst_edges)
+    print("Total weight of MST:", total_weight)
+
+    if np is not None:
+        print("Dense (adjacency matrix):", prim(adjacency_matrix(graph), start=0))
+
+if __name__ == "__main__":
+    main()
+    if "--bench" in sys.argv:
+        benchmark()
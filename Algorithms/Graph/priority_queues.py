@@ -0,0 +1,265 @@
+'''
+Addressable priority queues for Dijkstra and Prim.
+
+The heapq versions of Dijkstra and Prim push a new tuple on every improvement and skip stale
+entries when they are popped ("lazy deletion"), so the heap can hold O(E) entries.
+The queues below hold every vertex at most once and lower its priority in place instead.
+
+All backends share one interface over integer items 0..n-1:
+- push(item, priority): insert the item, or lower its priority if it is already queued
+- pop(): remove and return (priority, item) with the smallest priority
+- len(queue) / bool(queue)
+
+Backends:
+- IndexedHeap: binary heap + position array, push/decrease-key/pop are O(log n)
+- PairingHeap: decrease-key is O(1) (cut the subtree and meld it with the root),
+  pop is O(log n) amortized with the two-pass merge
+- BucketQueue: Dial's algorithm, one bucket per priority value for small integer weights.
+  Live priorities must stay within `max_weight` of each other (true for Dijkstra and Prim
+  when every edge weight is an integer in 0..max_weight), so max_weight + 1 buckets are
+  reused circularly. push is O(1) and pop is O(max_weight) worst case.
+
+new_queue(kind, n, max_weight) builds one by name, "heapq" keeps the lazy-deletion version.
+'''
+
+import sys
+from array import array
+
+
+class IndexedHeap:
+    def __init__(self, n, max_weight=None):
+        self.heap = []                      # items, heap ordered by key
+        self.pos = array('q', [-1]) * n     # index of every item in self.heap, -1 if absent
+        self.key = [0] * n
+
+    def __len__(self):
+        return len(self.heap)
+
+    def push(self, item, priority):
+        if self.pos[item] == -1:
+            self.heap.append(item)
+            self.pos[item] = len(self.heap) - 1
+        elif priority >= self.key[item]:
+            return
+        self.key[item] = priority
+        self._sift_up(self.pos[item])
+
+    def pop(self):
+        top = self.heap[0]
+        last = self.heap.pop()
+        self.pos[top] = -1
+        if self.heap:
+            self.heap[0] = last
+            self.pos[last] = 0
+            self._sift_down(0)
+        return self.key[top], top
+
+    def _sift_up(self, i):
+        heap, pos, key = self.heap, self.pos, self.key
+        item = heap[i]
+        while i > 0:
+            parent = (i - 1) // 2
+            if key[heap[parent]] <= key[item]:
+                break
+            heap[i] = heap[parent]
+            pos[heap[i]] = i
+            i = parent
+        heap[i] = item
+        pos[item] = i
+
+    def _sift_down(self, i):
+        heap, pos, key = self.heap, self.pos, self.key
+        item = heap[i]
+        size = len(heap)
+        while True:
+            child = 2 * i + 1
+            if child >= size:
+                break
+            if child + 1 < size and key[heap[child + 1]] < key[heap[child]]:
+                child += 1
+            if key[item] <= key[heap[child]]:
+                break
+            heap[i] = heap[child]
+            pos[heap[i]] = i
+            i = child
+        heap[i] = item
+        pos[item] = i
+
+
+class PairingNode:
+    __slots__ = ("item", "key", "child", "sibling", "prev")
+
+    def __init__(self, item, key):
+        self.item = item
+        self.key = key
+        self.child = None
+        self.sibling = None
+        self.prev = None    # parent if this is the first child, else the left sibling
+
+
+class PairingHeap:
+    def __init__(self, n, max_weight=None):
+        self.root = None
+        self.nodes = [None] * n
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def push(self, item, priority):
+        node = self.nodes[item]
+        if node is None:
+            node = self.nodes[item] = PairingNode(item, priority)
+            self.root = self._meld(self.root, node)
+            self.size += 1
+            return
+        if priority >= node.key:
+            return
+
+        # Decrease-key: cut the node's subtree out and meld it with the root
+        node.key = priority
+        if node is self.root:
+            return
+        if node.prev.child is node:
+            node.prev.child = node.sibling
+        else:
+            node.prev.sibling = node.sibling
+        if node.sibling is not None:
+            node.sibling.prev = node.prev
+        node.sibling = node.prev = None
+        self.root = self._meld(self.root, node)
+
+    def pop(self):
+        root = self.root
+        self.nodes[root.item] = None
+        self.size -= 1
+
+        # Two-pass merge: meld children in pairs left to right, then fold right to left
+        pairs = []
+        child = root.child
+        while child is not None:
+            first, second = child, child.sibling
+            child = second.sibling if second is not None else None
+            first.sibling = first.prev = None
+            if second is not None:
+                second.sibling = second.prev = None
+            pairs.append(self._meld(first, second))
+        merged = None
+        for tree in reversed(pairs):
+            merged = self._meld(tree, merged)
+        self.root = merged
+        return root.key, root.item
+
+    @staticmethod
+    def _meld(a, b):
+        if a is None:
+            return b
+        if b is None:
+            return a
+        if b.key < a.key:
+            a, b = b, a
+        # b becomes the first child of a
+        b.prev = a
+        b.sibling = a.child
+        if a.child is not None:
+            a.child.prev = b
+        a.child = b
+        return a
+
+
+class BucketQueue:
+    def __init__(self, n, max_weight):
+        self.buckets = [[] for _ in range(max_weight + 1)]
+        self.key = [-1] * n     # current priority of every queued item, -1 if absent
+        self.cursor = 0         # no queued priority is below this
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def push(self, item, priority):
+        if self.key[item] == -1:
+            self.size += 1
+        elif priority >= self.key[item]:
+            return
+        # The entry in the old bucket becomes stale and is skipped by pop
+        self.key[item] = priority
+        self.buckets[priority % len(self.buckets)].append(item)
+        if priority < self.cursor:
+            self.cursor = priority
+
+    def pop(self):
+        buckets, key = self.buckets, self.key
+        while True:
+            bucket = buckets[self.cursor % len(buckets)]
+            while bucket:
+                item = bucket.pop()
+                if key[item] == self.cursor:
+                    key[item] = -1
+                    self.size -= 1
+                    return self.cursor, item
+            self.cursor += 1
+
+
+QUEUES = {
+    "indexed": IndexedHeap,
+    "pairing": PairingHeap,
+    "bucket": BucketQueue,
+}
+
+
+def new_queue(kind, n, max_weight=None):
+    if kind not in QUEUES:
+        raise ValueError(f"Unknown queue {kind!r}, expected one of {sorted(QUEUES)} or 'heapq'")
+    return QUEUES[kind](n, max_weight)
+
+
+def max_edge_weight(graph):
+    # Largest weight of a {u: [(v, weight)]} dict or CSRGraph, needed to size a BucketQueue
+    return max((w for u in range(len(graph)) for _, w in graph[u]), default=0)
+
+
+# Benchmark matrix: Dijkstra and Prim with every backend across densities and weight ranges
+def benchmark(vertices=20_000):
+    import random
+    import time
+    from csr_graph import CSRGraph
+    from dijkstra_heap import Dijkstra
+    from mst_prim import prim
+
+    kinds = ["heapq"] + list(QUEUES)
+    print(f"{'algo':<9}{'degree':>7}{'weights':>9}" + "".join(f"{k:>10}" for k in kinds))
+    for degree in (4, 32):
+        for max_weight in (10, 1000):
+            rng = random.Random(degree * max_weight)
+            edges = [(rng.randrange(vertices), rng.randrange(vertices), rng.randint(1, max_weight))
+                     for _ in range(vertices * degree // 2)]
+            # Chain every vertex so the graph is connected for Prim
+            edges += [(v, v + 1, max_weight) for v in range(vertices - 1)]
+            graph = CSRGraph.from_edges(vertices, edges, directed=False)
+
+            for name, run in (("dijkstra", lambda q: Dijkstra(graph, 0, queue=q)),
+                              ("prim", lambda q: prim(graph, 0, queue=q))):
+                row = f"{name:<9}{degree:>7}{'1..' + str(max_weight):>9}"
+                for kind in kinds:
+                    start = time.perf_counter()
+                    run(kind)
+                    row += f"{time.perf_counter() - start:>10.2f}"
+                print(row)
+
+
+# Driver Code
+def main():
+    for kind in QUEUES:
+        queue = new_queue(kind, 6, max_weight=10)
+        for item, priority in [(0, 7), (1, 3), (2, 9), (3, 5), (4, 8), (5, 6)]:
+            queue.push(item, priority)
+        queue.push(2, 1)    # decrease-key
+        queue.push(1, 8)    # higher priority, ignored
+        print(kind, [queue.pop() for _ in range(len(queue))])
+
+
+if __name__ == "__main__":
+    main()
+    if "--bench" in sys.argv:
+        benchmark()
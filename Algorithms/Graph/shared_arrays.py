@@ -0,0 +1,82 @@
+'''
+NumPy arrays in shared memory for process pools.
+
+Arguments to ProcessPoolExecutor tasks are pickled for every call, which for the edge
+arrays of a large graph costs more than the work itself. Instead:
+- share(arrays) copies a dict of NumPy arrays once into multiprocessing.shared_memory
+  blocks and returns views onto them, the blocks and a small picklable spec per array
+  (block name, shape, dtype)
+- init_worker(specs), used as the pool initializer, attaches every block in the worker
+  and puts a view per array into worker_arrays, where the task functions read them
+- release(blocks) closes and unlinks the blocks once the pool is shut down
+
+Writes through the parent's views are seen by every worker without copying, which the
+engines use for arrays that change between rounds (component labels, distances).
+Used by mst_parallel.boruvka and delta_stepping.DeltaStepping.
+
+- Time Complexity: O(total bytes) to share, O(1) per array to attach
+- Space Complexity: one copy of the arrays in shared memory
+'''
+
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# Arrays attached in this process by init_worker, by name
+worker_arrays = {}
+_worker_blocks = []
+
+
+def share(arrays):
+    # arrays: {name: NumPy array}, returns (views, blocks, specs)
+    views, blocks, specs = {}, [], {}
+    try:
+        for name, arr in arrays.items():
+            block = shared_memory.SharedMemory(create=True, size=max(arr.nbytes, 1))
+            blocks.append(block)
+            view = np.ndarray(arr.shape, dtype=arr.dtype, buffer=block.buf)
+            view[:] = arr
+            views[name] = view
+            specs[name] = (block.name, arr.shape, arr.dtype.str)
+    except Exception:
+        release(blocks)
+        raise
+    return views, blocks, specs
+
+
+def init_worker(specs):
+    for name, (block_name, shape, dtype) in specs.items():
+        block = shared_memory.SharedMemory(name=block_name)
+        _worker_blocks.append(block)
+        worker_arrays[name] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+
+
+def release(blocks):
+    # Once the pool is shut down, no process uses the blocks any more
+    for block in blocks:
+        block.close()
+        block.unlink()
+
+
+def _worker_sum(bounds):
+    lo, hi = bounds
+    return int(worker_arrays["values"][lo:hi].sum())
+
+
+# Driver Code
+def main():
+    from concurrent.futures import ProcessPoolExecutor
+
+    views, blocks, specs = share({"values": np.arange(1_000_000, dtype=np.int64)})
+    try:
+        with ProcessPoolExecutor(2, initializer=init_worker, initargs=(specs,)) as pool:
+            print("Sum:", sum(pool.map(_worker_sum, [(0, 500_000), (500_000, 1_000_000)])))
+            # Workers see the parent's writes without copying
+            views["values"][:] = 1
+            print("Sum after the update:", sum(pool.map(_worker_sum, [(0, 500_000), (500_000, 1_000_000)])))
+    finally:
+        release(blocks)
+
+
+if __name__ == "__main__":
+    main()
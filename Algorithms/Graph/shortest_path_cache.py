@@ -0,0 +1,143 @@
+'''
+Versioned shortest-path cache with LRU eviction by bytes.
+
+MutableGraph is a weighted adjacency ({v: weight} per vertex) that counts its edits in
+`version` and notifies subscribers on every add / remove / reweight. It can be passed to
+dijkstra_heap.Dijkstra like the dict representation, since graph[u] yields (v, weight) pairs.
+
+ShortestPathCache sits in front of Dijkstra:
+- keys are (graph version, source, target) with target None for a full single-source row
+- values are array('d') distance rows or (distance, path) tuples, sized in bytes
+- an OrderedDict keeps LRU order, the least recently used entries are dropped once
+  the total size passes max_bytes
+- a point-to-point query is answered from a cached row of its source when there is one
+- any edit of the graph clears the cache (the version in the key also guards stale reads)
+
+A repeated query is a dict lookup plus a move_to_end, i.e. O(1).
+'''
+
+import sys
+from array import array
+from collections import OrderedDict
+
+from dijkstra_heap import Dijkstra
+from dijkstra_point_to_point import dijkstra_target
+
+
+class MutableGraph:
+    def __init__(self, vertices=0):
+        self.adj = [dict() for _ in range(vertices)]
+        self.version = 0
+        self.listeners = []
+
+    def __len__(self):
+        return len(self.adj)
+
+    def __getitem__(self, u):
+        return self.adj[u].items()
+
+    def subscribe(self, callback):
+        self.listeners.append(callback)
+
+    def add_edge(self, u, v, weight):
+        while len(self.adj) <= max(u, v):
+            self.adj.append(dict())
+        self.adj[u][v] = weight
+        self._changed()
+
+    def remove_edge(self, u, v):
+        del self.adj[u][v]
+        self._changed()
+
+    def set_weight(self, u, v, weight):
+        if v not in self.adj[u]:
+            raise KeyError(f"No edge {u} -> {v}")
+        self.adj[u][v] = weight
+        self._changed()
+
+    def _changed(self):
+        self.version += 1
+        for callback in self.listeners:
+            callback(self.version)
+
+
+class ShortestPathCache:
+    def __init__(self, graph, max_bytes=64 * 1024 * 1024):
+        self.graph = graph
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()    # key -> (value, size in bytes)
+        self.bytes = 0
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+        graph.subscribe(self.invalidate)
+
+    def distances(self, source):
+        # Full single-source distance row
+        key = (self.graph.version, source, None)
+        row = self._get(key)
+        if row is None:
+            row = array('d', Dijkstra(self.graph, source))
+            self._put(key, row, sys.getsizeof(row))
+        return row
+
+    def shortest_path(self, source, target):
+        # (distance, path) for one pair
+        key = (self.graph.version, source, target)
+        result = self._get(key)
+        if result is None:
+            result = dijkstra_target(self.graph, source, target)
+            self._put(key, result, sys.getsizeof(result[1]) + 8 * len(result[1]))
+        return result
+
+    def distance(self, source, target):
+        # Reuse a cached row of the source if there is one
+        key = (self.graph.version, source, None)
+        if key in self.entries:
+            return self._get(key)[target]
+        return self.shortest_path(source, target)[0]
+
+    def invalidate(self, version=None):
+        if self.entries:
+            self.stats["invalidations"] += 1
+        self.entries.clear()
+        self.bytes = 0
+
+    def _get(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            self.stats["misses"] += 1
+            return None
+        self.stats["hits"] += 1
+        self.entries.move_to_end(key)
+        return entry[0]
+
+    def _put(self, key, value, size):
+        # Entries bigger than the whole budget are returned but not cached
+        if size > self.max_bytes:
+            return
+        self.entries[key] = (value, size)
+        self.bytes += size
+        while self.bytes > self.max_bytes:
+            _, (_, evicted) = self.entries.popitem(last=False)
+            self.bytes -= evicted
+            self.stats["evictions"] += 1
+
+
+# Driver Code
+def main():
+    graph = MutableGraph()
+    for u, v, w in [(0, 1, 1), (1, 2, 2), (1, 3, 3), (2, 3, 1), (3, 4, 1), (2, 4, 5)]:
+        graph.add_edge(u, v, w)
+
+    cache = ShortestPathCache(graph, max_bytes=4096)
+    print("Distances from 0:", list(cache.distances(0)))
+    print("Distances from 0 again:", list(cache.distances(0)))
+    print("0 -> 4 from the cached row:", cache.distance(0, 4))
+    print("1 -> 4:", cache.shortest_path(1, 4))
+
+    graph.set_weight(3, 4, 10)
+    print("After reweighting 3 -> 4:", cache.shortest_path(1, 4))
+    print("Stats:", cache.stats, "bytes:", cache.bytes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+'''
+Incremental topological order (Pearce and Kelly).
+
+Keeps a topological order of a DAG while edges are added and removed, instead of rerunning
+Kahn's algorithm (topological_sorting_bfs_indegree) over the whole graph after every change.
+
+The order is a list `order` (vertex at each position) and its inverse `position`.
+- add_edge(u, v) with position[u] < position[v]: the order is still valid, nothing moves.
+- Otherwise only the "affected region" between position[v] and position[u] can be wrong:
+  1. forward DFS from v over vertices positioned before u (delta_F); reaching u means the
+     edge would close a cycle, it is rejected with ValueError and the graph is left unchanged
+  2. backward DFS from u over vertices positioned after v (delta_B)
+  3. delta_B and delta_F take over the union of their old positions, delta_B first, each
+     keeping its relative order. Every other vertex keeps its position.
+- remove_edge never invalidates an order, it is O(1).
+
+Vertices are 0..n-1; add_vertex() or an edge to an unknown vertex appends new vertices at
+the end of the order.
+
+- Time Complexity: add_edge is O(|delta| log |delta| + edges touching delta), where delta is
+  the affected region, usually far smaller than V + E
+- Space Complexity: O(V + E)
+'''
+
+import sys
+
+from topological_sorting_bfs_indegree import topological_sort
+
+
+class IncrementalTopologicalOrder:
+    def __init__(self, vertices=0, edges=None):
+        # Initial order from Kahn's algorithm (raises ValueError if the edges contain a cycle)
+        edges = list(edges or [])
+        self.order = topological_sort(vertices, edges) if edges else list(range(vertices))
+        self.position = [0] * vertices
+        for i, node in enumerate(self.order):
+            self.position[node] = i
+        self.succ = [set() for _ in range(vertices)]
+        self.pred = [set() for _ in range(vertices)]
+        for u, v in edges:
+            self.succ[u].add(v)
+            self.pred[v].add(u)
+        self.stats = {"reordered": 0}
+
+    def __len__(self):
+        return len(self.order)
+
+    def __iter__(self):
+        return iter(self.order)
+
+    def precedes(self, u, v):
+        return self.position[u] < self.position[v]
+
+    def add_vertex(self):
+        node = len(self.order)
+        self.order.append(node)
+        self.position.append(node)
+        self.succ.append(set())
+        self.pred.append(set())
+        return node
+
+    def add_edge(self, u, v):
+        while len(self.order) <= max(u, v):
+            self.add_vertex()
+        if u == v:
+            raise ValueError(f"Edge {u} -> {v} would create a cycle: [{u}, {u}]")
+        if v in self.succ[u]:
+            return
+
+        position = self.position
+        lower, upper = position[v], position[u]
+        if lower < upper:
+            # Step 1: Forward search from v, bounded by u's position
+            delta_f, cycle = self._search(v, self.succ, lambda p: p < upper, target=u)
+            if cycle:
+                raise ValueError(f"Edge {u} -> {v} would create a cycle: {cycle}")
+
+            # Step 2: Backward search from u, bounded by v's position
+            delta_b, _ = self._search(u, self.pred, lambda p: p > lower)
+
+            # Step 3: Reassign the freed positions, delta_B before delta_F
+            delta_b.sort(key=position.__getitem__)
+            delta_f.sort(key=position.__getitem__)
+            moved = delta_b + delta_f
+            slots = sorted(position[node] for node in moved)
+            for node, slot in zip(moved, slots):
+                position[node] = slot
+                self.order[slot] = node
+            self.stats["reordered"] += len(moved)
+
+        self.succ[u].add(v)
+        self.pred[v].add(u)
+
+    def remove_edge(self, u, v):
+        self.succ[u].remove(v)
+        self.pred[v].remove(u)
+
+    def _search(self, start, adj, inside, target=None):
+        # Iterative DFS over vertices whose position satisfies `inside`.
+        # Returns (visited vertices, None), or (None, cycle) when target is reached.
+        position = self.position
+        parent = {start: None}
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            for neighbor in adj[node]:
+                if neighbor == target:
+                    path = [neighbor]
+                    while node is not None:
+                        path.append(node)
+                        node = parent[node]
+                    path.reverse()
+                    return None, [target] + path
+                if neighbor not in parent and inside(position[neighbor]):
+                    parent[neighbor] = node
+                    stack.append(neighbor)
+        return list(parent), None
+
+
+# Benchmark: incremental order vs rerunning Kahn's algorithm after every edge
+def benchmark(vertices=5_000, num_edges=50_000, rerun_edges=200):
+    import random
+    import time
+
+    rng = random.Random(1)
+    # Edges follow a hidden random order, so the graph stays a DAG but arrives in a bad order
+    hidden = list(range(vertices))
+    rng.shuffle(hidden)
+    edges = set()
+    while len(edges) < num_edges:
+        a, b = sorted(rng.sample(range(vertices), 2))
+        edges.add((hidden[a], hidden[b]))
+    edges = list(edges)
+
+    dag = IncrementalTopologicalOrder(vertices)
+    start = time.perf_counter()
+    for u, v in edges:
+        dag.add_edge(u, v)
+    elapsed = time.perf_counter() - start
+    print(f"incremental: {elapsed / num_edges * 1e6:.1f}us per edge, "
+          f"{dag.stats['reordered'] / num_edges:.1f} vertices moved per edge")
+    assert all(dag.precedes(u, v) for u, v in edges)
+
+    start = time.perf_counter()
+    for i in range(rerun_edges):
+        topological_sort(vertices, edges[:num_edges - rerun_edges + i + 1])
+    elapsed = time.perf_counter() - start
+    print(f"Kahn rerun:  {elapsed / rerun_edges * 1e6:.1f}us per edge")
+
+
+# Driver Code
+def main():
+    dag = IncrementalTopologicalOrder(6, [(5, 2), (5, 0), (4, 0), (4, 1), (2, 3), (3, 1)])
+    print("Initial order:", dag.order)
+
+    dag.add_edge(0, 2)
+    print("After 0 -> 2:", dag.order)
+
+    try:
+        dag.add_edge(1, 5)
+    except ValueError as e:
+        print(e)
+
+    dag.remove_edge(3, 1)
+    dag.add_edge(1, 5)
+    print("After removing 3 -> 1 and adding 1 -> 5:", dag.order)
+
+if __name__ == "__main__":
+    main()
+    if "--bench" in sys.argv:
+        benchmark()
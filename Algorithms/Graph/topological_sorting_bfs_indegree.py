@@ -2,17 +2,18 @@
 This implementation implements Kahn's algorithm
 '''
 
-from collections import defaultdict, deque
+from collections import deque
+from csr_graph import as_adjacency
 
-def topological_sort(vertices, edges):
-    # Step 1: Initialize graph structures
-    adj_list = defaultdict(list)
-    in_degree = {i: 0 for i in range(vertices)}
+def topological_sort(vertices, edges=None):
+    # Step 1: Build the graph (vertices may also be a csr_graph.CSRGraph)
+    vertices, adj_list = as_adjacency(vertices, edges)
 
-    # Step 2: Build the graph and calculate in-degrees
-    for u, v in edges:
-        adj_list[u].append(v)
-        in_degree[v] += 1
+    # Step 2: Calculate in-degrees
+    in_degree = {i: 0 for i in range(vertices)}
+    for u in range(vertices):
+        for v in adj_list[u]:
+            in_degree[v] += 1
 
     # Step 3: Initialize the queue with nodes having in-degree 0
     queue = deque([node for node in in_degree if in_degree[node] == 0])
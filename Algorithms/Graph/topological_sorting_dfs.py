@@ -1,39 +1,17 @@
-from collections import defaultdict
+from csr_graph import as_adjacency
+from traversal import postorder
 
-def topological_sort(vertices, edges):
-    # Step 1: Initialize graph structures
-    adj_list = defaultdict(list)
-    for u, v in edges:
-        adj_list[u].append(v)
+def topological_sort(vertices, edges=None):
+    # Step 1: Initialize graph structures (vertices may also be a csr_graph.CSRGraph)
+    vertices, adj_list = as_adjacency(vertices, edges)
 
-    # Step 2: Perform DFS and record post-order
-    visited = [False] * vertices
-    rec_stack = [False] * vertices  # Tracks nodes in the current recursion stack
-    topo_stack = []
+    # Step 2: Iterative DFS over every vertex, recording the post-order
+    # (raises traversal.CycleError, a ValueError, with the cycle found)
+    order = list(postorder(adj_list, vertices))
 
-    def dfs(node):
-        visited[node] = True
-        rec_stack[node] = True
-
-        for neighbor in adj_list[node]:
-            if not visited[neighbor]:
-                if dfs(neighbor):
-                    return True
-            elif rec_stack[neighbor]:  # Cycle detected
-                return True
-
-        rec_stack[node] = False
-        topo_stack.append(node)
-        return False
-
-    # Step 3: Call DFS for all unvisited nodes
-    for node in range(vertices):
-        if not visited[node]:
-            if dfs(node):
-                raise ValueError("The graph contains a cycle")
-
-    # Step 4: Reverse the post-order stack to get topological order
-    return topo_stack[::-1]
+    # Step 3: Reverse the post-order to get topological order
+    order.reverse()
+    return order
 
 # Driver Code
 def main():
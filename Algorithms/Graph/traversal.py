@@ -0,0 +1,157 @@
+'''
+Iterative, generator based BFS and DFS.
+
+Both traversals take any adjacency where adj[u] lists the neighbors of u
+(a defaultdict(list), a list of lists, or csr_graph.CSRGraph.neighbor_view())
+and yield vertices lazily, so a million-node graph can be streamed without
+building result lists or hitting the recursion limit.
+
+- BFS uses a deque, so every dequeue is O(1) (list.pop(0) is O(n)).
+- DFS keeps an explicit stack of neighbor iterators, which visits vertices in
+  exactly the same order as the recursive version.
+
+Options shared by both:
+- with_info=True yields (vertex, depth, parent) instead of just the vertex (parent is -1 for the source)
+- visit(vertex, depth, parent) is called for every vertex before it is yielded
+- stop(vertex, depth) returning True ends the traversal right after that vertex
+  (breaking out of the for-loop works too, the generator does no extra work)
+
+postorder(adj, vertices) is the shared engine of the directed-graph algorithms
+(topological_sorting_dfs, cycle_detection_directed): a DFS over every vertex that
+yields vertices in post-order, with the classic three colors in a bytearray
+(white = unseen, gray = on the stack, black = finished), one byte per vertex.
+A gray neighbor is a back edge, i.e. a cycle; the stack at that moment holds the
+cycle's path, so CycleError carries the actual cycle, not just "there is one".
+
+- Time Complexity: O(V + E)
+- Space Complexity: O(V)
+'''
+
+from collections import deque
+
+WHITE, GRAY, BLACK = 0, 1, 2
+
+
+class CycleError(ValueError):
+    def __init__(self, cycle):
+        # cycle lists the vertices in edge order, cycle[-1] -> cycle[0] closes it
+        path = " -> ".join(str(v) for v in cycle + cycle[:1])
+        super().__init__(f"The graph contains a cycle: {path}")
+        self.cycle = cycle
+
+
+def bfs(adj, source, with_info=False, visit=None, stop=None):
+    visited = {source}
+    queue = deque([(source, 0, -1)])
+
+    while queue:
+        vertex, depth, parent = queue.popleft()
+
+        if visit is not None:
+            visit(vertex, depth, parent)
+        yield (vertex, depth, parent) if with_info else vertex
+        if stop is not None and stop(vertex, depth):
+            return
+
+        for neighbor in adj[vertex]:
+            if neighbor not in visited:
+                visited.add(neighbor)
+                queue.append((neighbor, depth + 1, vertex))
+
+
+def dfs(adj, source, with_info=False, visit=None, stop=None):
+    visited = {source}
+    # Each stack entry is (vertex, iterator over its remaining neighbors)
+    stack = [(source, iter(adj[source]))]
+    parent = -1
+
+    while True:
+        vertex = stack[-1][0]
+        depth = len(stack) - 1
+        if visit is not None:
+            visit(vertex, depth, parent)
+        yield (vertex, depth, parent) if with_info else vertex
+        if stop is not None and stop(vertex, depth):
+            return
+
+        # Find the next unvisited neighbor, backtracking while the top is exhausted
+        while stack:
+            vertex, neighbors = stack[-1]
+            child = next((v for v in neighbors if v not in visited), None)
+            if child is not None:
+                break
+            stack.pop()
+        if not stack:
+            return
+
+        visited.add(child)
+        stack.append((child, iter(adj[child])))
+        parent = vertex
+
+
+def postorder(adj, vertices, roots=None):
+    # roots: start vertices in order (default 0..vertices-1), already finished ones are skipped
+    color = bytearray(vertices)
+    for root in range(vertices) if roots is None else roots:
+        if color[root] != WHITE:
+            continue
+        color[root] = GRAY
+        # path holds the gray vertices, iters their remaining neighbors (two flat
+        # lists instead of a stack of tuples, it is noticeably faster)
+        path = [root]
+        iters = [iter(adj[root])]
+        push_vertex, push_iter = path.append, iters.append
+
+        while iters:
+            # Descend into the first white neighbor, or finish the vertex
+            for neighbor in iters[-1]:
+                state = color[neighbor]
+                if state == WHITE:
+                    color[neighbor] = GRAY
+                    push_vertex(neighbor)
+                    push_iter(iter(adj[neighbor]))
+                    break
+                if state == GRAY:
+                    # Back edge: the path from neighbor to the top is the cycle
+                    raise CycleError(path[len(path) - 1 - path[::-1].index(neighbor):])
+            else:
+                iters.pop()
+                vertex = path.pop()
+                color[vertex] = BLACK
+                yield vertex
+
+
+# Driver Code
+def main():
+    from collections import defaultdict
+
+    adj = defaultdict(list)
+    for u, v in [(0, 1), (0, 3), (1, 4), (1, 2), (2, 3), (4, 5), (4, 6), (5, 6)]:
+        adj[u].append(v)
+        adj[v].append(u)
+
+    print("BFS from 0:", list(bfs(adj, 0)))
+    print("DFS from 0:", list(dfs(adj, 0)))
+    print("BFS with (vertex, depth, parent):", list(bfs(adj, 0, with_info=True)))
+    print("BFS until vertex 2 is reached:", list(bfs(adj, 0, stop=lambda v, d: v == 2)))
+
+    # Stream a long path graph that would overflow the recursion limit
+    n = 1_000_000
+    path = [[i + 1] if i + 1 < n else [] for i in range(n)]
+    deepest = 0
+    for _, depth, _ in dfs(path, 0, with_info=True):
+        deepest = max(deepest, depth)
+    print("Deepest DFS level on a path of", n, "vertices:", deepest)
+
+    # Post-order over a directed graph, and the cycle once 3 -> 1 is added
+    directed = [[1, 2], [3], [3], []]
+    print("Post-order:", list(postorder(directed, 4)))
+    directed[3].append(1)
+    try:
+        list(postorder(directed, 4))
+    except CycleError as e:
+        print(e, e.cycle)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,61 +1,223 @@
+'''
+Disjoint Set Union (Union-Find).
+
+- find uses path halving: every node on the way up is pointed at its grandparent.
+  It is iterative, so long parent chains never hit the recursion limit, and it gives
+  the same amortized bound as full path compression.
+- union by size: the smaller tree is attached under the root of the larger one.
+- parent and size live in array('i') buffers (4 bytes per node) instead of lists of boxed ints.
+
+Bulk helpers for large inputs:
+- union_many(edges): union every (u, v) pair, returns a bytearray with 1 for the pairs that
+  merged two sets (i.e. the spanning-forest edges, exactly what Kruskal needs)
+- find_many(nodes): roots of many nodes at once
+- components(): dense component labels 0..k-1 for every node, plus k
+- extend(n): grow to n nodes, for streams that discover vertices as they go
+
+Pairs and nodes may be Python sequences or NumPy arrays.
+
+RollbackDSU is the variant for offline algorithms that walk a timeline and step back
+(see dynamic_connectivity.py):
+- union by rank and no path compression, since compression rewrites parents an undo
+  could not cheaply restore, so find is O(log n) worst case
+- every successful union pushes (attached root, new root, rank bumped) on an undo stack;
+  snapshot() returns the stack height and rollback(snapshot) pops back to it, O(1) per union
+
+- Time Complexity: O(alpha(n)) amortized per operation
+- Space Complexity: O(n)
+'''
+
+import sys
+from array import array
+
+
 class DSU:
-     
-    
+
     # Constructor
     def __init__(self, n):
-        # Declaring two arrays to hold
-        # information about parent and 
-        # rank of each node. 
-        #           &
-        # Defining size of the arrays.
-        # Initializing their values 
-        # by i's and 0s.
-        self.parent = [i for i in range(n)]
-        self.rank = [0 for i in range(n)]
-        
-    
+        # parent[i] == i marks a root, size is only
+        # meaningful for roots.
+        self.parent = array('i', range(n))
+        self.size = array('i', [1]) * n
+
+    def __len__(self):
+        return len(self.parent)
+
+    def extend(self, n):
+        # Grow to n nodes, the new ones are singletons (for streams
+        # where the number of vertices is not known up front)
+        if n > len(self.parent):
+            self.size.extend(array('i', [1]) * (n - len(self.parent)))
+            self.parent.extend(range(len(self.parent), n))
+
     # Find function
     def find(self, node):
-        
-        # If the node is the parent of 
-        # itself then it is the leader 
-        # of the tree. 
-        if(node==self.parent[node]):
-            return node
-        
-        #Else, finding parent and also 
-        # compressing the paths.
-        self.parent[node] = self.find(self.parent[node])
-        return self.parent[node]
-    
-    # Union function 
-    def union(self,u, v):
-        
-        # Make u as a leader 
-        # of its tree.
-        u=self.find(u)
-        
-        # Make v as a leader 
-        # of its tree.
-        v=self.find(v)
-        
-        # If u and v are not equal,
-        # because if they are equal then
-        # it means they are already in 
-        # same tree and it does not make 
-        # sense to perform union operation.
-        if(u!=v):
-            # Checking tree with 
-            # smaller depth/height.
-            if(self.rank[u]<self.rank[v]):
+        parent = self.parent
+        # Path halving: skip every other node on the
+        # way to the root while walking up.
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    # Union function, returns True if u and v were
+    # in different sets.
+    def union(self, u, v):
+        u = self.find(u)
+        v = self.find(v)
+
+        # Already in the same tree, nothing to do.
+        if u == v:
+            return False
+
+        # Attach the smaller tree under the larger one.
+        if self.size[u] < self.size[v]:
+            u, v = v, u
+        self.parent[v] = u
+        self.size[u] += self.size[v]
+        return True
+
+    def union_many(self, edges):
+        # edges: iterable of (u, v) pairs or an (m, 2) NumPy array
+        if hasattr(edges, "tolist"):
+            edges = edges.tolist()
+        parent, size = self.parent, self.size
+        merged = bytearray(len(edges))
+
+        # Same as union(), inlined to avoid a method call per edge
+        for i, (u, v) in enumerate(edges):
+            while parent[u] != u:
+                parent[u] = parent[parent[u]]
+                u = parent[u]
+            while parent[v] != v:
+                parent[v] = parent[parent[v]]
+                v = parent[v]
+            if u == v:
+                continue
+            if size[u] < size[v]:
                 u, v = v, u
+            parent[v] = u
+            size[u] += size[v]
+            merged[i] = 1
+        return merged
+
+    def find_many(self, nodes):
+        if hasattr(nodes, "tolist"):
+            nodes = nodes.tolist()
+        find = self.find
+        return array('i', [find(node) for node in nodes])
+
+    def components(self):
+        # Label every node with the index of its set, in order of first appearance
+        labels = array('i', [-1]) * len(self.parent)
+        root_label = {}
+        for node in range(len(self.parent)):
+            root = self.find(node)
+            if root not in root_label:
+                root_label[root] = len(root_label)
+            labels[node] = root_label[root]
+        return labels, len(root_label)
+
+
+class RollbackDSU:
+    # Union by rank without path compression, so every union can be undone
+
+    def __init__(self, n):
+        self.parent = array('i', range(n))
+        self.rank = array('b', [0]) * n
+        self.count = n  # number of sets
+        self.history = []
+
+    def find(self, node):
+        parent = self.parent
+        while parent[node] != node:
+            node = parent[node]
+        return node
+
+    def union(self, u, v):
+        u = self.find(u)
+        v = self.find(v)
+        if u == v:
+            return False
+        if self.rank[u] < self.rank[v]:
+            u, v = v, u
+        bumped = self.rank[u] == self.rank[v]
+        self.parent[v] = u
+        if bumped:
+            self.rank[u] += 1
+        self.count -= 1
+        self.history.append((v, u, bumped))
+        return True
+
+    def connected(self, u, v):
+        return self.find(u) == self.find(v)
+
+    def snapshot(self):
+        return len(self.history)
+
+    def rollback(self, snapshot=0):
+        # Undo every union made after the snapshot, newest first
+        history = self.history
+        while len(history) > snapshot:
+            v, u, bumped = history.pop()
+            self.parent[v] = v
+            if bumped:
+                self.rank[u] -= 1
+            self.count += 1
+
+
+# Benchmark: 10M unions on 1M nodes, one at a time and in bulk
+def benchmark(n=1_000_000, num_unions=10_000_000):
+    import random
+    import time
+
+    rng = random.Random(1)
+    pairs = [(rng.randrange(n), rng.randrange(n)) for _ in range(num_unions)]
+
+    dsu = DSU(n)
+    start = time.perf_counter()
+    for u, v in pairs:
+        dsu.union(u, v)
+    print(f"union():      {time.perf_counter() - start:.2f}s")
+
+    dsu = DSU(n)
+    start = time.perf_counter()
+    dsu.union_many(pairs)
+    print(f"union_many(): {time.perf_counter() - start:.2f}s")
+
+    start = time.perf_counter()
+    _, count = dsu.components()
+    print(f"components(): {time.perf_counter() - start:.2f}s, {count} components")
+
+    # A 1M long chain, which overflows a recursive find before compression
+    chain = DSU(n)
+    for i in range(n - 1):
+        chain.parent[i] = i + 1
+    start = time.perf_counter()
+    root = chain.find(0)
+    print(f"find() on a {n} long chain: {time.perf_counter() - start:.2f}s, root {root}")
+
+
+# Driver Code
+def main():
+    dsu = DSU(7)
+    merged = dsu.union_many([(0, 1), (1, 2), (2, 0), (3, 4), (5, 6), (4, 6)])
+    print("Merged:", list(merged))
+    print("Roots:", list(dsu.find_many(range(7))))
+    labels, count = dsu.components()
+    print("Labels:", list(labels), "count:", count)
+
+    dsu = RollbackDSU(4)
+    dsu.union(0, 1)
+    mark = dsu.snapshot()
+    dsu.union(2, 3)
+    dsu.union(1, 2)
+    print("Before rollback, 0 ~ 3:", dsu.connected(0, 3))
+    dsu.rollback(mark)
+    print("After rollback, 0 ~ 3:", dsu.connected(0, 3), "0 ~ 1:", dsu.connected(0, 1))
+
 
-            # Attaching lower rank tree
-            # to the higher one. 
-            self.parent[v]=u
-            
-            # If now ranks were equal
-            # increasing rank of u. 
-            if(self.rank[u]==self.rank[v]):
-                self.rank[u]=self.rank[u]+1
-    
+if __name__ == "__main__":
+    main()
+    if "--bench" in sys.argv:
+        benchmark()